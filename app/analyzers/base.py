@@ -10,6 +10,7 @@ Design Pattern: Strategy Pattern
 - Can be swapped at runtime based on project language
 """
 
+import os
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from pathlib import Path
@@ -140,16 +141,30 @@ class ILanguageAnalyzer(ABC):
         
         Default implementation: recursively find files with language-specific extension
         Can be overridden for special cases
-        
+
+        Uses a single os.scandir walk instead of one rglob pass per
+        extension, so the directory tree is read from disk only once.
+
         Returns:
             List of source file paths
         """
-        extensions = self._get_file_extensions()
+        extensions = tuple(self._get_file_extensions())
         source_files = []
-        
-        for ext in extensions:
-            source_files.extend(self.project_path.rglob(f"*{ext}"))
-        
+
+        stack = [str(self.project_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(extensions):
+                            source_files.append(Path(entry.path))
+            except OSError:
+                # Unreadable directory - skip it, like rglob did
+                continue
+
         return source_files
     
     @abstractmethod
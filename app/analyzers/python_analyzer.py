@@ -18,7 +18,13 @@ Key Features:
 """
 
 import ast
+import hashlib
+import logging
+import mmap
 import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from datetime import datetime
@@ -31,10 +37,57 @@ from app.models.core import (
 )
 
 
+# Decorator fragments that mark entry points, compiled once:
+# Flask routes (@app.route), Click commands (@click.command),
+# FastAPI handlers (@app.get, @app.post, @app.put, @app.delete)
+_ENTRY_DECORATOR_RE = re.compile(r'route|command|get|post|put|delete', re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+# Node types that add a decision point to cyclomatic complexity.
+# Exact-type set membership replaces chained isinstance checks in the
+# counting loop (ast node classes have no relevant subclasses here).
+_DECISION_NODE_TYPES = frozenset({
+    ast.If, ast.For, ast.While, ast.ExceptHandler, ast.And, ast.Or
+})
+
+# Exact-type dispatch tags for the extraction traversal, precompiled so
+# the hot loop does one dict lookup instead of an isinstance chain
+_FUNCTION_KIND = 'function'
+_CLASS_KIND = 'class'
+_NODE_KIND = {
+    ast.FunctionDef: _FUNCTION_KIND,
+    ast.AsyncFunctionDef: _FUNCTION_KIND,
+    ast.ClassDef: _CLASS_KIND,
+}
+
+# CodeNode types whose bodies are scanned for calls
+_CALLABLE_NODE_TYPES = frozenset({NodeType.FUNCTION, NodeType.METHOD})
+
+
+# Worker-side analyzer for parallel parsing. Built once per worker
+# process by the pool initializer so each submitted task pickles only
+# its file path - submitting a bound method would serialize the whole
+# analyzer (AST cache and node indexes included) with every task.
+_worker_analyzer: Optional['PythonAnalyzer'] = None
+
+
+def _init_parse_worker(project_path: Path, language: Language,
+                       cache_dir: Optional[Path]) -> None:
+    """Pool initializer: build this worker's analyzer once"""
+    global _worker_analyzer
+    _worker_analyzer = PythonAnalyzer(project_path, language, cache_dir)
+
+
+def _parse_file_worker(file_path: Path) -> List[CodeNode]:
+    """Parse one file with the worker-local analyzer"""
+    return _worker_analyzer.parse_file(file_path)
+
+
 class PythonAnalyzer(ILanguageAnalyzer):
     """
     Python-specific code analyzer
-    
+
     Implements complete analysis pipeline:
     1. Find all .py files
     2. Parse each file with ast module
@@ -43,11 +96,30 @@ class PythonAnalyzer(ILanguageAnalyzer):
     5. Identify entry points (main, handlers, etc.)
     6. Calculate complexity metrics
     """
-    
-    def __init__(self, project_path: Path, language: Language = Language.PYTHON):
+
+    # Minimum number of files before parallel parsing pays for the
+    # process pool startup cost (parsing is CPU-bound, so threads won't help)
+    PARALLEL_MIN_FILES = 16
+
+    # Files at least this large are memory-mapped for parsing
+    MMAP_MIN_SIZE = 1 << 20  # 1 MiB
+
+    def __init__(self, project_path: Path, language: Language = Language.PYTHON,
+                 cache_dir: Optional[Path] = None):
+        """
+        Args:
+            project_path: Path to the project root directory
+            language: Programming language of the project
+            cache_dir: Optional directory for a persistent parse cache.
+                Extracted nodes are stored per file keyed by (path, mtime,
+                size), so unchanged files skip parsing on re-analysis.
+        """
         super().__init__(project_path, language)
         self.nodes_by_id: Dict[str, CodeNode] = {}
         self.nodes_by_file: Dict[str, List[CodeNode]] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._ast_cache: Dict[str, ast.AST] = {}  # file path -> parsed tree
+        self._node_id_by_name: Dict[str, str] = {}  # name -> first node id
     
     def analyze(self) -> AnalysisResult:
         """
@@ -66,16 +138,14 @@ class PythonAnalyzer(ILanguageAnalyzer):
                 raise AnalysisError(f"No Python files found in {self.project_path}")
             
             # Phase 2: Parse all files and extract nodes
+            # (total LOC accumulated here instead of a separate pass later)
             all_nodes = []
-            for file_path in source_files:
-                try:
-                    nodes = self.parse_file(file_path)
-                    all_nodes.extend(nodes)
-                    self.nodes_by_file[str(file_path)] = nodes
-                except ParseError as e:
-                    # Log error but continue with other files
-                    print(f"Warning: Failed to parse {file_path}: {e}")
-                    continue
+            total_loc = 0
+            for file_path, nodes in self._parse_source_files(source_files):
+                all_nodes.extend(nodes)
+                self._register_nodes(file_path, nodes)
+                for node in nodes:
+                    total_loc += node.loc
             
             # Phase 3: Build call graph
             call_graph = self.build_call_graph(all_nodes)
@@ -86,8 +156,7 @@ class PythonAnalyzer(ILanguageAnalyzer):
             
             # Phase 5: Create result
             analysis_time = time.time() - start_time
-            total_loc = sum(node.loc for node in all_nodes)
-            
+
             result = AnalysisResult(
                 project_id=str(self.project_path),
                 language=self.language,
@@ -106,7 +175,61 @@ class PythonAnalyzer(ILanguageAnalyzer):
             
         except Exception as e:
             raise AnalysisError(f"Analysis failed: {str(e)}") from e
-    
+
+    def _parse_source_files(
+        self, source_files: List[Path]
+    ) -> List[Tuple[Path, List[CodeNode]]]:
+        """
+        Parse all source files, in parallel for large projects
+
+        Parsing is CPU-bound and independent per file, so large projects are
+        farmed out to a ProcessPoolExecutor. Small projects are parsed
+        serially to avoid pool startup overhead.
+
+        Returns:
+            List of (file_path, nodes) pairs in source file order,
+            skipping files that failed to parse
+        """
+        results = []
+
+        if len(source_files) >= self.PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor(
+                initializer=_init_parse_worker,
+                initargs=(self.project_path, self.language, self.cache_dir)
+            ) as executor:
+                futures = [
+                    (file_path, executor.submit(_parse_file_worker, file_path))
+                    for file_path in source_files
+                ]
+                for file_path, future in futures:
+                    try:
+                        results.append((file_path, future.result()))
+                    except ParseError as e:
+                        logger.warning("Failed to parse %s: %s", file_path, e)
+        else:
+            for file_path in source_files:
+                try:
+                    results.append((file_path, self.parse_file(file_path)))
+                except ParseError as e:
+                    logger.warning("Failed to parse %s: %s", file_path, e)
+
+        return results
+
+    def _register_nodes(self, file_path: Path, nodes: List[CodeNode]) -> None:
+        """
+        Register parsed nodes in all lookup indexes in one pass
+
+        Keeps the three views of the same node set (by id, by file, by
+        name) in sync without iterating the node list once per index.
+        """
+        self.nodes_by_file[str(file_path)] = nodes
+        nodes_by_id = self.nodes_by_id
+        node_id_by_name = self._node_id_by_name
+        for node in nodes:
+            nodes_by_id[node.id] = node
+            # First node with a given name wins, like the old linear scan
+            node_id_by_name.setdefault(node.name, node.id)
+
     def parse_file(self, file_path: Path) -> List[CodeNode]:
         """
         Parse a Python file and extract code nodes
@@ -117,43 +240,124 @@ class PythonAnalyzer(ILanguageAnalyzer):
         Returns:
             List of CodeNode objects (functions, classes, methods)
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
+        cached_nodes = self._load_cached_nodes(file_path)
+        if cached_nodes is not None:
+            return cached_nodes
+
+        # Read raw bytes and let the parser handle decoding (PEP 263
+        # encoding declarations included) - one read, no upfront decode pass.
+        # Large files are memory-mapped so the parser consumes the page
+        # cache directly instead of an extra read() copy.
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= self.MMAP_MIN_SIZE:
+                try:
+                    source_code = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    source_code = f.read()
+            else:
                 source_code = f.read()
-        
+
+        try:
+            return self._extract_nodes(file_path, source_code)
+        finally:
+            if isinstance(source_code, mmap.mmap):
+                source_code.close()
+
+    def _extract_nodes(self, file_path: Path, source_code) -> List[CodeNode]:
+        """Parse a buffer of source bytes and extract its code nodes"""
         try:
             tree = ast.parse(source_code, filename=str(file_path))
-        except SyntaxError as e:
-            raise ParseError(f"Syntax error in {file_path}: {e}")
-        
+        except SyntaxError:
+            # Includes decode failures; retry with the old latin-1 fallback
+            try:
+                tree = ast.parse(bytes(source_code).decode('latin-1'), filename=str(file_path))
+            except SyntaxError as e:
+                raise ParseError(f"Syntax error in {file_path}: {e}")
+        except ValueError as e:
+            # Bad or unknown encoding declaration
+            raise ParseError(f"Cannot decode {file_path}: {e}")
+
+        # Keep the tree so build_call_graph() doesn't re-read and re-parse
+        self._ast_cache[str(file_path)] = tree
+
         nodes = []
-        
-        # Extract top-level functions and classes
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                code_node = self._extract_function(node, file_path, source_code)
-                nodes.append(code_node)
-                self.nodes_by_id[code_node.id] = code_node
-            
-            elif isinstance(node, ast.ClassDef):
-                code_node = self._extract_class(node, file_path)
+
+        # Extract functions, classes and methods in a single traversal.
+        # The stack carries the enclosing class name so methods are extracted
+        # exactly once (the old ast.walk pass saw them a second time as
+        # plain functions). Registration in nodes_by_id happens in analyze(),
+        # so this method stays side-effect free and safe for worker processes.
+        stack: List[Tuple[ast.AST, Optional[str]]] = [
+            (stmt, None) for stmt in reversed(tree.body)
+        ]
+        while stack:
+            node, class_name = stack.pop()
+            kind = _NODE_KIND.get(type(node))
+
+            if kind is _FUNCTION_KIND:
+                if class_name is None:
+                    code_node = self._extract_function(node, file_path)
+                else:
+                    code_node = self._extract_method(node, class_name, file_path)
                 nodes.append(code_node)
-                self.nodes_by_id[code_node.id] = code_node
-                
-                # Also extract methods
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_node = self._extract_method(item, node.name, file_path, source_code)
-                        nodes.append(method_node)
-                        self.nodes_by_id[method_node.id] = method_node
-        
+                # Defs nested inside a function body are plain functions
+                stack.extend((child, None) for child in reversed(node.body))
+
+            elif kind is _CLASS_KIND:
+                nodes.append(self._extract_class(node, file_path))
+                stack.extend((child, node.name) for child in reversed(node.body))
+
+            else:
+                # Defs can hide inside if/try/with blocks - keep descending
+                stack.extend(
+                    (child, class_name) for child in ast.iter_child_nodes(node)
+                )
+
+        self._store_cached_nodes(file_path, nodes)
         return nodes
+
+    def _cache_path(self, file_path: Path) -> Path:
+        """Cache file location for a source file"""
+        digest = hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _load_cached_nodes(self, file_path: Path) -> Optional[List[CodeNode]]:
+        """
+        Load cached nodes for a file if still valid
+
+        The cache entry stores the file's mtime and size at parse time;
+        any mismatch (or unreadable/corrupt entry) is treated as a miss.
+        Cached hits skip parsing entirely - build_call_graph re-parses
+        lazily via _get_tree only for files that actually need it.
+        """
+        if self.cache_dir is None:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+            with open(self._cache_path(file_path), 'rb') as f:
+                entry = pickle.load(f)
+            if entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+                return entry['nodes']
+        except (OSError, pickle.PickleError, KeyError, EOFError):
+            pass
+        return None
+
+    def _store_cached_nodes(self, file_path: Path, nodes: List[CodeNode]) -> None:
+        """Persist extracted nodes for a file (best effort)"""
+        if self.cache_dir is None:
+            return
+
+        try:
+            stat = os.stat(file_path)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'nodes': nodes}
+            with open(self._cache_path(file_path), 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Cache is an optimization - never fail the parse
     
-    def _extract_function(self, node: ast.FunctionDef, file_path: Path, source_code: str) -> CodeNode:
+    def _extract_function(self, node: ast.FunctionDef, file_path: Path) -> CodeNode:
         """Extract function information from AST node"""
         # Generate unique ID
         node_id = f"{file_path.name}::{node.name}"
@@ -164,7 +368,7 @@ class PythonAnalyzer(ILanguageAnalyzer):
         # Extract return type
         return_type = None
         if node.returns:
-            return_type = ast.unparse(node.returns) if hasattr(ast, 'unparse') else self._ast_to_string(node.returns)
+            return_type = self._ast_to_string(node.returns)
         
         # Extract decorators
         decorators = [self._ast_to_string(dec) for dec in node.decorator_list]
@@ -172,8 +376,8 @@ class PythonAnalyzer(ILanguageAnalyzer):
         # Extract docstring
         docstring = ast.get_docstring(node)
         
-        # Calculate complexity
-        complexity = self.calculate_complexity(None, source_code)  # We'll improve this
+        # Calculate complexity from this function's own subtree
+        complexity = self._count_decision_points(node)
         
         # Calculate LOC
         loc = node.end_lineno - node.lineno + 1 if node.end_lineno else 1
@@ -203,8 +407,8 @@ class PythonAnalyzer(ILanguageAnalyzer):
             loc=loc
         )
     
-    def _extract_method(self, node: ast.FunctionDef, class_name: str, 
-                        file_path: Path, source_code: str) -> CodeNode:
+    def _extract_method(self, node: ast.FunctionDef, class_name: str,
+                        file_path: Path) -> CodeNode:
         """Extract method information (similar to function but with class context)"""
         node_id = f"{file_path.name}::{class_name}.{node.name}"
         
@@ -212,11 +416,11 @@ class PythonAnalyzer(ILanguageAnalyzer):
         
         return_type = None
         if node.returns:
-            return_type = ast.unparse(node.returns) if hasattr(ast, 'unparse') else self._ast_to_string(node.returns)
+            return_type = self._ast_to_string(node.returns)
         
         decorators = [self._ast_to_string(dec) for dec in node.decorator_list]
         docstring = ast.get_docstring(node)
-        complexity = self.calculate_complexity(None, source_code)
+        complexity = self._count_decision_points(node)
         loc = node.end_lineno - node.lineno + 1 if node.end_lineno else 1
         is_async = isinstance(node, ast.AsyncFunctionDef)
         is_generator = self._is_generator(node)
@@ -249,9 +453,11 @@ class PythonAnalyzer(ILanguageAnalyzer):
         decorators = [self._ast_to_string(dec) for dec in node.decorator_list]
         loc = node.end_lineno - node.lineno + 1 if node.end_lineno else 1
         
-        # Count methods
-        method_count = sum(1 for item in node.body 
-                          if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)))
+        # Count methods inline (no generator frame per class)
+        method_count = 0
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                method_count += 1
         
         return CodeNode(
             id=node_id,
@@ -272,30 +478,55 @@ class PythonAnalyzer(ILanguageAnalyzer):
     def _extract_parameters(self, args: ast.arguments) -> List[Parameter]:
         """Extract function parameters from AST"""
         parameters = []
-        
+        first_default = len(args.args) - len(args.defaults)
+
         # Regular arguments
-        for arg in args.args:
+        for arg_index, arg in enumerate(args.args):
             type_hint = None
             if arg.annotation:
-                type_hint = ast.unparse(arg.annotation) if hasattr(ast, 'unparse') else self._ast_to_string(arg.annotation)
-            
-            # Find default value
+                type_hint = self._ast_to_string(arg.annotation)
+
+            # Find default value (defaults align with the trailing arguments)
             default_value = None
-            arg_index = args.args.index(arg)
-            default_index = arg_index - (len(args.args) - len(args.defaults))
+            default_index = arg_index - first_default
             if default_index >= 0:
-                default_value = ast.unparse(args.defaults[default_index]) if hasattr(ast, 'unparse') else self._ast_to_string(args.defaults[default_index])
-            
+                default_value = self._ast_to_string(args.defaults[default_index])
+
             parameters.append(Parameter(
                 name=arg.arg,
                 type_hint=type_hint,
                 default_value=default_value
             ))
-        
+
         return parameters
     
     def _ast_to_string(self, node: ast.AST) -> str:
-        """Convert AST node to string representation"""
+        """
+        Convert AST node to string representation
+
+        Names, dotted attributes and constants cover nearly all annotations
+        and decorators, so handle them directly before paying for the
+        general ast.unparse machinery. (An lru_cache would not help here:
+        AST nodes hash by identity, so equal annotations from different
+        call sites never share a cache entry.)
+        """
+        if isinstance(node, ast.Name):
+            return node.id
+
+        if isinstance(node, ast.Constant):
+            return repr(node.value)
+
+        if isinstance(node, ast.Attribute):
+            # Unroll dotted chains like app.route / click.command
+            parts = [node.attr]
+            value = node.value
+            while isinstance(value, ast.Attribute):
+                parts.append(value.attr)
+                value = value.value
+            if isinstance(value, ast.Name):
+                parts.append(value.id)
+                return '.'.join(reversed(parts))
+
         if hasattr(ast, 'unparse'):
             return ast.unparse(node)
         # Fallback for older Python versions
@@ -303,9 +534,14 @@ class PythonAnalyzer(ILanguageAnalyzer):
     
     def _is_generator(self, node: ast.FunctionDef) -> bool:
         """Check if function is a generator"""
-        for subnode in ast.walk(node):
+        # Explicit stack instead of ast.walk: this runs once per function,
+        # and skipping the generator machinery makes the early exit cheap
+        stack = list(ast.iter_child_nodes(node))
+        while stack:
+            subnode = stack.pop()
             if isinstance(subnode, (ast.Yield, ast.YieldFrom)):
                 return True
+            stack.extend(ast.iter_child_nodes(subnode))
         return False
     
     def build_call_graph(self, nodes: List[CodeNode]) -> CallGraph:
@@ -319,28 +555,35 @@ class PythonAnalyzer(ILanguageAnalyzer):
             CallGraph with nodes and edges
         """
         edges = []
-        
-        # Re-parse files to find function calls
+
+        # Name index is normally filled by _register_nodes during analyze();
+        # rebuild it here only if build_call_graph is called standalone
+        if not self._node_id_by_name:
+            for node in nodes:
+                self._node_id_by_name.setdefault(node.name, node.id)
+
+        # Walk each file's AST to find function calls
         for file_path, file_nodes in self.nodes_by_file.items():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    source_code = f.read()
-                tree = ast.parse(source_code)
-                
+                tree = self._get_tree(file_path)
+
+                # Index this file's function defs by name once, instead of
+                # re-walking the whole tree for every extracted node
+                func_defs = self._index_function_defs(tree)
+
                 # Find calls in each function
                 for node in file_nodes:
-                    if node.node_type in [NodeType.FUNCTION, NodeType.METHOD]:
-                        calls = self._find_calls_in_function(tree, node.name, nodes)
+                    if node.node_type in _CALLABLE_NODE_TYPES:
+                        calls = self._find_calls_in_function(func_defs.get(node.name))
+                        if not calls:
+                            continue  # Leaf function - nothing to record
                         node.calls.update(calls)
-                        
-                        # Update called_by relationships
-                        for called_id in calls:
-                            if called_id in self.nodes_by_id:
-                                self.nodes_by_id[called_id].called_by.add(node.id)
-                        
-                        # Create edges
+
+                        # Update called_by and create edges in one pass
                         for called_id in calls:
-                            if called_id in self.nodes_by_id:
+                            target = self.nodes_by_id.get(called_id)
+                            if target is not None:
+                                target.called_by.add(node.id)
                                 edges.append(CallEdge(
                                     source=node.id,
                                     target=called_id,
@@ -348,7 +591,7 @@ class PythonAnalyzer(ILanguageAnalyzer):
                                 ))
             
             except Exception as e:
-                print(f"Warning: Failed to build call graph for {file_path}: {e}")
+                logger.warning("Failed to build call graph for %s: %s", file_path, e)
                 continue
         
         return CallGraph(
@@ -357,24 +600,62 @@ class PythonAnalyzer(ILanguageAnalyzer):
             entry_points=[]  # Will be set by identify_entry_points
         )
     
-    def _find_calls_in_function(self, tree: ast.AST, func_name: str, all_nodes: List[CodeNode]) -> Set[str]:
-        """Find all function calls within a specific function"""
-        calls = set()
-        
-        # Find the function definition
+    def _get_tree(self, file_path: str) -> ast.AST:
+        """
+        Get the parsed AST for a file, reusing the cache from parse_file
+
+        Files parsed in worker processes (parallel path) are not in the
+        parent's cache, so fall back to reading and parsing once here.
+        """
+        tree = self._ast_cache.get(file_path)
+        if tree is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                source_code = f.read()
+            tree = ast.parse(source_code, filename=file_path)
+            self._ast_cache[file_path] = tree
+        return tree
+
+    def _index_function_defs(self, tree: ast.AST) -> Dict[str, ast.AST]:
+        """
+        Index a file's function definitions by name
+
+        First definition in walk order wins, matching the old scan-and-break
+        behavior when names collide (e.g. a method shadowing a function).
+        """
+        func_defs: Dict[str, ast.AST] = {}
         for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name:
-                # Find all Call nodes within this function
-                for subnode in ast.walk(node):
-                    if isinstance(subnode, ast.Call):
-                        called_name = self._get_call_name(subnode.func)
-                        if called_name:
-                            # Try to match with known functions
-                            matched_id = self._match_function_call(called_name, all_nodes)
-                            if matched_id:
-                                calls.add(matched_id)
-                break
-        
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                func_defs.setdefault(node.name, node)
+        return func_defs
+
+    def _find_calls_in_function(self, func_def: Optional[ast.AST]) -> Optional[Set[str]]:
+        """
+        Find all function calls within a function definition
+
+        Returns None when the function makes no matched calls, so leaf
+        functions (the common case) never allocate a result set.
+        """
+        calls = None
+
+        if func_def is None:
+            return calls
+
+        # Find all Call nodes within this function (explicit stack, see
+        # _is_generator for rationale)
+        stack = list(ast.iter_child_nodes(func_def))
+        while stack:
+            subnode = stack.pop()
+            if isinstance(subnode, ast.Call):
+                called_name = self._get_call_name(subnode.func)
+                if called_name:
+                    # Try to match with known functions
+                    matched_id = self._match_function_call(called_name)
+                    if matched_id:
+                        if calls is None:
+                            calls = set()
+                        calls.add(matched_id)
+            stack.extend(ast.iter_child_nodes(subnode))
+
         return calls
     
     def _get_call_name(self, node: ast.AST) -> Optional[str]:
@@ -385,13 +666,10 @@ class PythonAnalyzer(ILanguageAnalyzer):
             return node.attr
         return None
     
-    def _match_function_call(self, call_name: str, all_nodes: List[CodeNode]) -> Optional[str]:
+    def _match_function_call(self, call_name: str) -> Optional[str]:
         """Match a function call to a known function"""
-        # Simple matching: look for function with same name
-        for node in all_nodes:
-            if node.name == call_name:
-                return node.id
-        return None
+        # Simple matching: look up function with same name
+        return self._node_id_by_name.get(call_name)
     
     def identify_entry_points(self, nodes: List[CodeNode]) -> List[str]:
         """
@@ -410,17 +688,12 @@ class PythonAnalyzer(ILanguageAnalyzer):
             if node.name == 'main':
                 entry_points.append(node.id)
             
-            # Check for decorators indicating entry points
+            # Check for decorators indicating entry points (single precompiled
+            # scan instead of per-keyword substring searches on a lowered copy)
             for decorator in node.decorators:
-                # Flask routes: @app.route
-                if 'route' in decorator.lower():
-                    entry_points.append(node.id)
-                # Click commands: @click.command
-                elif 'command' in decorator.lower():
-                    entry_points.append(node.id)
-                # FastAPI routes: @app.get, @app.post
-                elif any(method in decorator.lower() for method in ['get', 'post', 'put', 'delete']):
+                if _ENTRY_DECORATOR_RE.search(decorator):
                     entry_points.append(node.id)
+                    break  # One entry per node, even with several route decorators
         
         return entry_points
     
@@ -435,17 +708,31 @@ class PythonAnalyzer(ILanguageAnalyzer):
         """
         try:
             tree = ast.parse(source_code)
-            complexity = 1
-            
-            for subnode in ast.walk(tree):
-                if isinstance(subnode, (ast.If, ast.For, ast.While, ast.ExceptHandler)):
-                    complexity += 1
-                elif isinstance(subnode, (ast.And, ast.Or)):
-                    complexity += 1
-            
-            return complexity
+            return self._count_decision_points(tree)
         except:
             return 1  # Default complexity
+
+    def _count_decision_points(self, root: ast.AST) -> int:
+        """
+        Count decision points in a subtree (tight pure-Python kernel)
+
+        Hot inner loop of complexity scoring: explicit stack, exact-type
+        set membership and locals bound outside the loop.
+        """
+        complexity = 1
+        decision_types = _DECISION_NODE_TYPES
+        iter_child_nodes = ast.iter_child_nodes
+
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            subnode = pop()
+            if type(subnode) in decision_types:
+                complexity += 1
+            extend(iter_child_nodes(subnode))
+
+        return complexity
     
     def _get_file_extensions(self) -> List[str]:
         """Get Python file extensions"""
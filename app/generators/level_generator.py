@@ -12,8 +12,9 @@ Features:
 - Learning objective generation
 """
 
+import heapq
 import random
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, NamedTuple, Set, Optional, Tuple
 from pathlib import Path
 
 from app.models.core import (
@@ -22,6 +23,53 @@ from app.models.core import (
 )
 
 
+def _build_proximity_prefix(limit: int) -> Tuple[float, ...]:
+    """Prefix sums of the 40 * 0.7**i proximity decay series"""
+    prefix = [0.0]
+    total = 0.0
+    for i in range(limit):
+        total += 40 * (0.7 ** i)
+        prefix.append(total)
+    return tuple(prefix)
+
+
+# _PROXIMITY_PREFIX[n] is the total proximity score of an n-node chain,
+# so scoring a chain is one table lookup instead of n pow() calls.
+# 32 entries comfortably covers the depth-limited chains we generate.
+_PROXIMITY_LIMIT = 32
+_PROXIMITY_PREFIX = _build_proximity_prefix(_PROXIMITY_LIMIT)
+
+# Difficulty thresholds as plain ints - comparing cached ints avoids the
+# enum .value descriptor lookups in the per-chain selection logic
+_INTERMEDIATE = Difficulty.INTERMEDIATE.value
+_ADVANCED = Difficulty.ADVANCED.value
+
+
+# Static challenge content. Frozen tuples are allocated once at import and
+# shared by every generated challenge instead of a fresh list per call;
+# hints are never mutated downstream, only forwarded to the result.
+_ARCH_OPTIONS = ("Decorator", "Factory", "Observer", "Strategy")
+_ARCH_HINTS = ("Look at how functions are wrapped",)
+_COMPLETION_HINTS = ("Think about the function's purpose",)
+_DEBUGGING_HINTS = ("Check the return type",)
+
+
+class _ChainStats(NamedTuple):
+    """Per-chain aggregates, computed in one pass over the graph
+
+    Importance scoring, difficulty scoring and challenge-type selection
+    all need (subsets of) these quantities; bundling them means each
+    chain probes the node dict once instead of once per consumer.
+    """
+    node_count: int  # chain ids actually present in the graph
+    total_called_by: int
+    total_complexity: int
+    documented_count: int
+    abstraction_score: int
+    total_deps: int
+    has_decorators: bool
+
+
 class LevelGenerator:
     """
    Generates learning levels from call graphs
@@ -34,9 +82,25 @@ class LevelGenerator:
     5. Add hints and learning objectives
     """
     
-    def __init__(self, call_graph: CallGraph):
+    # Multiple-choice question templates, prepared once at class creation.
+    # Only the dynamic pieces (names, counts) are formatted per challenge.
+    _MC_PROMPT_BEHAVIOR = "What does the function {name}() do?"
+    _MC_PROMPT_PARAMS = "How many parameters does {name}() accept?"
+    _MC_BEHAVIOR_DISTRACTORS = ("Parses input", "Validates data", "Formats output")
+
+    # XP per difficulty, indexed by Difficulty value (1..5; slot 0 unused).
+    # A tuple index beats rebuilding a dict on every level.
+    _XP_REWARDS = (0, 50, 100, 150, 200, 300)
+
+    def __init__(self, call_graph: CallGraph, seed: Optional[int] = None):
         self.call_graph = call_graph
         self.generated_levels: List[Level] = []
+        # Instance-local RNG: skips the random-module lock on every draw
+        # and makes generation reproducible when a seed is supplied
+        self._rng = random.Random(seed)
+        self._chain_cache: Dict[str, List[Tuple[str, ...]]] = {}  # entry id -> chains
+        self._node_names: Dict[str, str] = {}  # node id -> display name
+        self._stats_cache: Dict[Tuple[str, ...], _ChainStats] = {}
     
     def generate_levels(self, max_levels: int = 10) -> List[Level]:
         """
@@ -48,12 +112,9 @@ class LevelGenerator:
         Returns:
             List of generated levels
         """
-        # Phase 1: Identify core chains
-        core_chains = self.identify_core_chains()
-        
-        # Limit to max_levels
-        core_chains = core_chains[:max_levels]
-        
+        # Phase 1: Identify the top max_levels core chains
+        core_chains = self.identify_core_chains(max_levels)
+
         levels = []
         for i, chain in enumerate(core_chains):
             # Phase 2: Calculate difficulty
@@ -76,90 +137,156 @@ class LevelGenerator:
         self.generated_levels = levels
         return levels
     
-    def identify_core_chains(self) -> List[List[str]]:
+    def identify_core_chains(self, max_chains: int = 10) -> List[List[str]]:
         """
         Identify the most important call chains to teach
-        
+
         Uses weighted scoring:
         - Entry point proximity (40%): Closer to entry = more important
         - Call frequency (30%): More callers = more central
         - Code complexity (20%): Higher complexity = worth teaching
         - Documentation quality (10%): Better docs = better learning
-        
+
+        Args:
+            max_chains: Maximum number of chains to return
+
         Returns:
-            List of call chains, ordered by importance
+            List of the top max_chains call chains, ordered by importance
         """
-        all_chains = []
-        
+        # Bounded candidate selection: keep a running min-heap of the
+        # best 3x max_chains scored chains and cap how many chains any
+        # single root contributes. Pathological graphs can produce tens
+        # of thousands of chains; this keeps scoring cost and memory
+        # proportional to the requested level count instead.
+        heap_cap = max_chains * 3
+        per_root_cap = max_chains * 4
+        heap: List[Tuple[float, List[str]]] = []
+
+        def consider_root(root_id: str):
+            considered = 0
+            for chain in self._get_chains(root_id):
+                if len(chain) < 2:  # Need at least 2 functions
+                    continue
+                if considered >= per_root_cap:
+                    break
+                considered += 1
+                score = self._calculate_chain_importance(chain)
+                if len(heap) < heap_cap:
+                    heapq.heappush(heap, (score, chain))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, chain))
+
         # Get chains from each entry point
         for entry_id in self.call_graph.entry_points:
-            if entry_id not in self.call_graph.nodes:
-                continue
-            
-            chains = self.call_graph.get_call_chain(entry_id, max_depth=5)
-            
-            for chain in chains:
-                if len(chain) >= 2:  # Need at least 2 functions
-                    score = self._calculate_chain_importance(chain)
-                    all_chains.append((score, chain))
-        
+            if entry_id in self.call_graph.nodes:
+                consider_root(entry_id)
+
         # If no entry points, try from highly connected nodes
-        if not all_chains:
-            # Find nodes with most connections
-            sorted_nodes = sorted(
+        if not heap:
+            # Find the 5 nodes with most connections; a bounded heap
+            # selection beats sorting the whole node set for the top few
+            top_nodes = heapq.nlargest(
+                5,
                 self.call_graph.nodes.values(),
-                key=lambda n: len(n.called_by),
-                reverse=True
+                key=lambda n: len(n.called_by)
             )
-            
-            for node in sorted_nodes[:5]:
-                chains = self.call_graph.get_call_chain(node.id, max_depth=5)
-                for chain in chains:
-                    if len(chain) >= 2:
-                        score = self._calculate_chain_importance(chain)
-                        all_chains.append((score, chain))
-        
-        # Sort by score and return top chains
-        all_chains.sort(reverse=True, key=lambda x: x[0])
-        return [chain for score, chain in all_chains]
+            for node in top_nodes:
+                consider_root(node.id)
+
+        # Heap-select the top chains: O(N log k) instead of sorting
+        # every candidate chain just to keep the first max_chains
+        top = heapq.nlargest(max_chains, heap, key=lambda sc: sc[0])
+        return [chain for score, chain in top]
     
+    def _get_chains(self, entry_id: str) -> List[Tuple[str, ...]]:
+        """Get call chains for an entry, memoized per entry id
+
+        generate_levels can be called repeatedly and entry points can
+        reappear in the highly-connected fallback, so the DFS per entry
+        runs at most once per generator.
+        """
+        chains = self._chain_cache.get(entry_id)
+        if chains is None:
+            chains = self.call_graph.get_call_chain(entry_id, max_depth=5)
+            self._chain_cache[entry_id] = chains
+        return chains
+
+    def _get_chain_stats(self, chain: List[str]) -> _ChainStats:
+        """Aggregate per-node quantities for a chain in a single pass
+
+        Memoized per chain: importance scoring, difficulty scoring and
+        challenge-type selection all consume the same aggregates, so the
+        node dict is probed once per chain instead of once per consumer.
+        """
+        key = tuple(chain)
+        stats = self._stats_cache.get(key)
+        if stats is not None:
+            return stats
+
+        get_node = self.call_graph.nodes.get
+        node_count = 0
+        total_called_by = 0
+        total_complexity = 0
+        documented_count = 0
+        abstraction_score = 0
+        total_deps = 0
+        has_decorators = False
+        for node_id in chain:
+            node = get_node(node_id)
+            if node is None:
+                continue
+            node_count += 1
+            total_called_by += len(node.called_by)
+            total_complexity += node.complexity
+            if node.docstring:
+                documented_count += 1
+            if node.decorators:
+                has_decorators = True
+                abstraction_score += len(node.decorators) * 3
+            if node.is_async:
+                abstraction_score += 5
+            if node.is_generator:
+                abstraction_score += 5
+            total_deps += len(node.depends_on)
+
+        stats = _ChainStats(
+            node_count=node_count,
+            total_called_by=total_called_by,
+            total_complexity=total_complexity,
+            documented_count=documented_count,
+            abstraction_score=abstraction_score,
+            total_deps=total_deps,
+            has_decorators=has_decorators,
+        )
+        self._stats_cache[key] = stats
+        return stats
+
     def _calculate_chain_importance(self, chain: List[str]) -> float:
         """Calculate importance score for a call chain"""
         score = 0.0
-        
+
         # Entry point proximity (40 points max)
-        for i, node_id in enumerate(chain):
-            proximity_score = 40 * (0.7 ** i)
-            score += proximity_score
-        
+        if len(chain) < _PROXIMITY_LIMIT:
+            score += _PROXIMITY_PREFIX[len(chain)]
+        else:
+            score += _PROXIMITY_PREFIX[_PROXIMITY_LIMIT]
+            for i in range(_PROXIMITY_LIMIT, len(chain)):
+                score += 40 * (0.7 ** i)
+
+        stats = self._get_chain_stats(chain)
+
         # Call frequency (30 points max)
-        total_called_by = sum(
-            len(self.call_graph.nodes[id].called_by)
-            for id in chain
-            if id in self.call_graph.nodes
-        )
-        avg_called_by = total_called_by / len(chain) if chain else 0
-        frequency_score = min(30, avg_called_by * 5)
-        score += frequency_score
-        
+        avg_called_by = stats.total_called_by / len(chain) if chain else 0
+        score += min(30, avg_called_by * 5)
+
         # Code complexity (20 points max)
-        total_complexity = sum(
-            self.call_graph.nodes[id].complexity
-            for id in chain
-            if id in self.call_graph.nodes
-        )
-        avg_complexity = total_complexity / len(chain) if chain else 0
-        complexity_score = min(20, avg_complexity)
-        score += complexity_score
-        
+        avg_complexity = stats.total_complexity / len(chain) if chain else 0
+        score += min(20, avg_complexity)
+
         # Documentation quality (10 points max)
-        documented_count = sum(
-            1 for id in chain
-            if id in self.call_graph.nodes and self.call_graph.nodes[id].docstring
-        )
-        doc_score = (documented_count / len(chain)) * 10 if chain else 0
+        doc_score = (stats.documented_count / len(chain)) * 10 if chain else 0
         score += doc_score
-        
+
         return score
     
     def calculate_difficulty(self, chain: List[str]) -> Difficulty:
@@ -180,43 +307,26 @@ class LevelGenerator:
         80+: Expert
         """
         score = 0
-        
+
         # Chain length (0-20 points)
         length_score = min(20, len(chain) * 4)
         score += length_score
-        
+
+        # All per-node aggregates come from the shared one-pass stats
+        stats = self._get_chain_stats(chain)
+
         # Average complexity (0-30 points)
-        complexities = [
-            self.call_graph.nodes[id].complexity
-            for id in chain
-            if id in self.call_graph.nodes
-        ]
-        avg_complexity = sum(complexities) / len(complexities) if complexities else 0
+        avg_complexity = (
+            stats.total_complexity / stats.node_count if stats.node_count else 0
+        )
         complexity_score = min(30, avg_complexity * 2)
         score += complexity_score
-        
+
         # Abstraction level (0-25 points)
-        abstraction_score = 0
-        for node_id in chain:
-            if node_id not in self.call_graph.nodes:
-                continue
-            
-            node = self.call_graph.nodes[node_id]
-            abstraction_score += len(node.decorators) * 3
-            if node.is_async:
-                abstraction_score += 5
-            if node.is_generator:
-                abstraction_score += 5
-        abstraction_score = min(25, abstraction_score)
-        score += abstraction_score
-        
+        score += min(25, stats.abstraction_score)
+
         # Dependencies (0-25 points)
-        total_deps = sum(
-            len(self.call_graph.nodes[id].depends_on)
-            for id in chain
-            if id in self.call_graph.nodes
-        )
-        dep_score = min(25, total_deps * 2)
+        dep_score = min(25, stats.total_deps * 2)
         score += dep_score
         
         # Map to difficulty
@@ -256,33 +366,27 @@ class LevelGenerator:
         if len(chain) >= 3:
             challenges.append(ChallengeType.CODE_TRACING)
         
-        # Get chain characteristics
-        has_decorators = any(
-            self.call_graph.nodes[id].decorators
-            for id in chain
-            if id in self.call_graph.nodes
-        )
-        
-        avg_complexity = sum(
-            self.call_graph.nodes[id].complexity
-            for id in chain
-            if id in self.call_graph.nodes
-        ) / len(chain) if chain else 0
-        
+        # Chain characteristics from the shared one-pass stats
+        stats = self._get_chain_stats(chain)
+        has_decorators = stats.has_decorators
+        avg_complexity = stats.total_complexity / len(chain) if chain else 0
+
+        difficulty_value = difficulty.value
+
         # Fill Blank for pattern-heavy code
-        if has_decorators or difficulty.value >= Difficulty.INTERMEDIATE.value:
+        if has_decorators or difficulty_value >= _INTERMEDIATE:
             challenges.append(ChallengeType.FILL_BLANK)
-        
+
         # Code Completion for intermediate+
-        if difficulty.value >= Difficulty.INTERMEDIATE.value:
+        if difficulty_value >= _INTERMEDIATE:
             challenges.append(ChallengeType.CODE_COMPLETION)
-        
+
         # Debugging for complex functions
         if avg_complexity > 10:
             challenges.append(ChallengeType.DEBUGGING)
-        
+
         # Architecture for advanced
-        if difficulty.value >= Difficulty.ADVANCED.value:
+        if difficulty_value >= _ADVANCED:
             challenges.append(ChallengeType.ARCHITECTURE)
         
         return challenges[:5]  # Max 5 challenges per level
@@ -293,21 +397,10 @@ class LevelGenerator:
         chain: List[str]
     ) -> Optional[Challenge]:
         """Generate a specific challenge"""
-        
-        if challenge_type == ChallengeType.MULTIPLE_CHOICE:
-            return self._generate_multiple_choice(chain)
-        elif challenge_type == ChallengeType.CODE_TRACING:
-            return self._generate_code_tracing(chain)
-        elif challenge_type == ChallengeType.FILL_BLANK:
-            return self._generate_fill_blank(chain)
-        elif challenge_type == ChallengeType.CODE_COMPLETION:
-            return self._generate_code_completion(chain)
-        elif challenge_type == ChallengeType.DEBUGGING:
-            return self._generate_debugging(chain)
-        elif challenge_type == ChallengeType.ARCHITECTURE:
-            return self._generate_architecture(chain)
-        
-        return None
+        generator = self._GENERATORS.get(challenge_type)
+        if generator is None:
+            return None
+        return generator(self, chain)
     
     def _generate_multiple_choice(self, chain: List[str]) -> Challenge:
         """Generate multiple choice question"""
@@ -315,50 +408,48 @@ class LevelGenerator:
             return None
         
         node = self.call_graph.nodes[chain[0]]
-        
-        # Question templates
-        templates = [
-            {
-                'prompt': f"What does the function {node.name}() do?",
-                'correct': node.docstring.split('.')[0] if node.docstring else "Processes data",
-                'distractors': ["Parses input", "Validates data", "Formats output"]
-            },
-            {
-                'prompt': f"How many parameters does {node.name}() accept?",
-                'correct': str(len(node.parameters)),
-                'distractors': [str(len(node.parameters) + i) for i in [-1, 1, 2] if len(node.parameters) + i >= 0]
-            }
-        ]
-        
-        template = random.choice(templates)
-        
+
+        # Pick a template first so only the chosen one is materialized
+        if self._rng.randrange(2) == 0:
+            prompt = self._MC_PROMPT_BEHAVIOR.format(name=node.name)
+            correct = node.docstring.split('.')[0] if node.docstring else "Processes data"
+            distractors = self._MC_BEHAVIOR_DISTRACTORS
+        else:
+            prompt = self._MC_PROMPT_PARAMS.format(name=node.name)
+            param_count = len(node.parameters)
+            correct = str(param_count)
+            distractors = [str(param_count + i) for i in (-1, 1, 2) if param_count + i >= 0]
+
         # Create options (correct + distractors)
-        options = [template['correct']] + template['distractors'][:3]
-        random.shuffle(options)
+        options = [correct, *distractors[:3]]
+        self._rng.shuffle(options)
         
         return Challenge(
             id=f"mc_{chain[0]}",
             type=ChallengeType.MULTIPLE_CHOICE,
             question={
-                'prompt': template['prompt'],
+                'prompt': prompt,
                 'options': options
             },
-            answer={'correct': template['correct']},
+            answer={'correct': correct},
             hints=[f"Check the function signature at line {node.line_start}"],
             points=10
         )
     
     def _generate_code_tracing(self, chain: List[str]) -> Challenge:
         """Generate code tracing challenge"""
+        # Resolve every display name once; prompt, answer and hint all
+        # reuse the same list instead of re-probing per reference
+        names = [self._get_node_name(node_id) for node_id in chain]
         return Challenge(
             id=f"trace_{chain[0]}",
             type=ChallengeType.CODE_TRACING,
             question={
-                'prompt': f"Trace the execution flow from {self._get_node_name(chain[0])} to {self._get_node_name(chain[-1])}",
+                'prompt': f"Trace the execution flow from {names[0]} to {names[-1]}",
                 'steps': len(chain)
             },
-            answer={'chain': [self._get_node_name(id) for id in chain]},
-            hints=[f"Start with {self._get_node_name(chain[0])}"],
+            answer={'chain': names},
+            hints=[f"Start with {names[0]}"],
             points=15
         )
     
@@ -391,7 +482,7 @@ class LevelGenerator:
                 'template': "def function():\n    # TODO: implement"
             },
             answer={'code': "pass"},
-            hints=["Think about the function's purpose"],
+            hints=_COMPLETION_HINTS,
             points=20
         )
     
@@ -405,7 +496,7 @@ class LevelGenerator:
                 'buggy_code': "def func():\n    return None"
             },
             answer={'fixed_code': "def func():\n    return True"},
-            hints=["Check the return type"],
+            hints=_DEBUGGING_HINTS,
             points=15
         )
     
@@ -416,13 +507,24 @@ class LevelGenerator:
             type=ChallengeType.ARCHITECTURE,
             question={
                 'prompt': "What design pattern is used here?",
-                'options': ["Decorator", "Factory", "Observer", "Strategy"]
+                'options': _ARCH_OPTIONS
             },
             answer={'pattern': "Decorator"},
-            hints=["Look at how functions are wrapped"],
+            hints=_ARCH_HINTS,
             points=15
         )
-    
+
+    # O(1) dispatch for generate_challenge - replaces the per-challenge
+    # if/elif chain over every ChallengeType
+    _GENERATORS = {
+        ChallengeType.MULTIPLE_CHOICE: _generate_multiple_choice,
+        ChallengeType.CODE_TRACING: _generate_code_tracing,
+        ChallengeType.FILL_BLANK: _generate_fill_blank,
+        ChallengeType.CODE_COMPLETION: _generate_code_completion,
+        ChallengeType.DEBUGGING: _generate_debugging,
+        ChallengeType.ARCHITECTURE: _generate_architecture,
+    }
+
     def _create_level(
         self,
         level_num: int,
@@ -470,10 +572,13 @@ class LevelGenerator:
         )
     
     def _get_node_name(self, node_id: str) -> str:
-        """Get node name from ID"""
-        if node_id in self.call_graph.nodes:
-            return self.call_graph.nodes[node_id].name
-        return node_id.split("::")[-1]
+        """Get node name from ID (memoized - ids repeat across challenges)"""
+        name = self._node_names.get(node_id)
+        if name is None:
+            node = self.call_graph.nodes.get(node_id)
+            name = node.name if node is not None else node_id.split("::")[-1]
+            self._node_names[node_id] = name
+        return name
     
     def _generate_level_name(self, entry_node: Optional[CodeNode], difficulty: Difficulty) -> str:
         """Generate a descriptive level name"""
@@ -534,16 +639,18 @@ class LevelGenerator:
     def _generate_objectives(self, chain: List[str]) -> List[str]:
         """Generate learning objectives"""
         objectives = []
-        
+
         if chain:
+            # Only the endpoints are named here; both hit the memoized
+            # name map already warmed by the tracing challenge
             start = self._get_node_name(chain[0])
             end = self._get_node_name(chain[-1])
             objectives.append(f"Trace execution from {start} to {end}")
-        
+
         # Add more specific objectives based on node characteristics
         for node_id in chain[:3]:  # First 3 nodes
-            if node_id in self.call_graph.nodes:
-                node = self.call_graph.nodes[node_id]
+            node = self.call_graph.nodes.get(node_id)
+            if node is not None:
                 if node.decorators:
                     objectives.append(f"Understand {node.decorators[0]} pattern")
                 if node.is_async:
@@ -553,14 +660,7 @@ class LevelGenerator:
     
     def _calculate_xp_reward(self, difficulty: Difficulty) -> int:
         """Calculate XP reward based on difficulty"""
-        rewards = {
-            Difficulty.TUTORIAL: 50,
-            Difficulty.BASIC: 100,
-            Difficulty.INTERMEDIATE: 150,
-            Difficulty.ADVANCED: 200,
-            Difficulty.EXPERT: 300
-        }
-        return rewards.get(difficulty, 100)
+        return self._XP_REWARDS[int(difficulty)]
 
 
 # ============================================
@@ -13,9 +13,11 @@ Design Principles:
 5. Rich Metadata: Include all info needed for level generation
 """
 
+import json
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Any
-from enum import Enum
+from typing import List, Dict, Optional, Set, Tuple, Any
+from enum import IntEnum, StrEnum
 from datetime import datetime
 
 
@@ -23,13 +25,13 @@ from datetime import datetime
 # Enums
 # ============================================
 
-class Language(str, Enum):
+class Language(StrEnum):
     """Supported programming languages"""
     PYTHON = "python"
     GOLANG = "golang"
 
 
-class ChallengeType(str, Enum):
+class ChallengeType(StrEnum):
     """Types of challenges we can generate"""
     MULTIPLE_CHOICE = "multiple_choice"
     CODE_TRACING = "code_tracing"
@@ -40,7 +42,7 @@ class ChallengeType(str, Enum):
     MINI_PROJECT = "mini_project"
 
 
-class NodeType(str, Enum):
+class NodeType(StrEnum):
     """Types of code nodes"""
     FUNCTION = "function"
     METHOD = "method"
@@ -49,7 +51,7 @@ class NodeType(str, Enum):
     MODULE = "module"
 
 
-class Difficulty(int, Enum):
+class Difficulty(IntEnum):
     """Difficulty levels"""
     TUTORIAL = 1
     BASIC = 2
@@ -62,7 +64,7 @@ class Difficulty(int, Enum):
 # Core Code Representation
 # ============================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Parameter:
     """Function/method parameter"""
     name: str
@@ -77,7 +79,7 @@ class Parameter:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeNode:
     """
     Language-agnostic representation of a code element
@@ -119,7 +121,19 @@ class CodeNode:
     
     # Additional metadata (language-specific)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+
+    def __post_init__(self):
+        # Node ids recur in calls/called_by sets across the whole graph;
+        # interning stores each id string once and turns the hot
+        # membership checks in the traversals into pointer comparisons
+        self.id = sys.intern(self.id)
+        if self.calls:
+            self.calls = {sys.intern(s) for s in self.calls}
+        if self.called_by:
+            self.called_by = {sys.intern(s) for s in self.called_by}
+        if self.depends_on:
+            self.depends_on = {sys.intern(s) for s in self.depends_on}
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict"""
         return {
@@ -133,9 +147,12 @@ class CodeNode:
             'parameters': [p.to_dict() for p in self.parameters],
             'return_type': self.return_type,
             'decorators': self.decorators,
-            'calls': list(self.calls),
-            'called_by': list(self.called_by),
-            'depends_on': list(self.depends_on),
+            # sorted() gives deterministic output for identical graphs
+            # (stable diffs, cacheable payloads) at the same O(n) cost
+            # class as the arbitrary-order list() copies it replaces
+            'calls': sorted(self.calls),
+            'called_by': sorted(self.called_by),
+            'depends_on': sorted(self.depends_on),
             'docstring': self.docstring,
             'is_exported': self.is_exported,
             'is_async': self.is_async,
@@ -148,6 +165,9 @@ class CodeNode:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CodeNode':
         """Deserialize from dict"""
+        # Bulk deserialization constructs thousands of nodes; binding
+        # data.get once trims a method lookup per optional field
+        get = data.get
         return cls(
             id=data['id'],
             name=data['name'],
@@ -156,30 +176,42 @@ class CodeNode:
             file_path=data['file_path'],
             line_start=data['line_start'],
             line_end=data['line_end'],
-            parameters=[Parameter(**p) for p in data.get('parameters', [])],
-            return_type=data.get('return_type'),
-            decorators=data.get('decorators', []),
-            calls=set(data.get('calls', [])),
-            called_by=set(data.get('called_by', [])),
-            depends_on=set(data.get('depends_on', [])),
-            docstring=data.get('docstring'),
-            is_exported=data.get('is_exported', True),
-            is_async=data.get('is_async', False),
-            is_generator=data.get('is_generator', False),
-            complexity=data.get('complexity', 1),
-            loc=data.get('loc', 0),
-            metadata=data.get('metadata', {})
+            parameters=[
+                Parameter(
+                    name=p['name'],
+                    type_hint=p.get('type'),
+                    default_value=p.get('default')
+                )
+                for p in get('parameters') or ()
+            ],
+            return_type=get('return_type'),
+            decorators=get('decorators') or [],
+            calls=set(get('calls') or ()),
+            called_by=set(get('called_by') or ()),
+            depends_on=set(get('depends_on') or ()),
+            docstring=get('docstring'),
+            is_exported=get('is_exported', True),
+            is_async=get('is_async', False),
+            is_generator=get('is_generator', False),
+            complexity=get('complexity', 1),
+            loc=get('loc', 0),
+            metadata=get('metadata') or {}
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallEdge:
     """Represents a function call relationship"""
     source: str  # Calling function ID
     target: str  # Called function ID
     call_type: str = "direct"  # direct, indirect, polymorphic
     line_number: Optional[int] = None
-    
+
+    def __post_init__(self):
+        # Share the interned id strings with the node objects
+        self.source = sys.intern(self.source)
+        self.target = sys.intern(self.target)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'source': self.source,
@@ -189,7 +221,7 @@ class CallEdge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CallGraph:
     """
     Call graph representation
@@ -201,81 +233,169 @@ class CallGraph:
     nodes: Dict[str, CodeNode]  # node_id -> CodeNode
     edges: List[CallEdge]
     entry_points: List[str]  # IDs of entry point functions (main, handlers, etc.)
-    
-    # Graph metadata
-    total_nodes: int = 0
-    total_edges: int = 0
-    max_depth: int = 0
-    
-    def __post_init__(self):
-        """Calculate derived metrics"""
-        self.total_nodes = len(self.nodes)
-        self.total_edges = len(self.edges)
-        self.max_depth = self._calculate_max_depth()
-    
+
+    # Cache slot for the lazily computed max depth
+    _max_depth: Optional[int] = field(default=None, init=False, repr=False)
+
+    # Dense traversal index, built lazily on first traversal: node ids
+    # mapped to consecutive ints so visited tracking becomes a flat
+    # byte-array store instead of hashing id strings into sets
+    _node_index: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    _index_ids: Optional[List[str]] = field(default=None, init=False, repr=False)
+    _adjacency: Optional[List[List[int]]] = field(default=None, init=False, repr=False)
+    _is_leaf: Optional[List[bool]] = field(default=None, init=False, repr=False)
+
+    # Graph metadata is derived on demand: counts are O(1) reads and the
+    # expensive depth DFS only runs if a caller actually asks for it
+    # (construction paths like to_dot or single-node queries skip it)
+    @property
+    def total_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def total_edges(self) -> int:
+        return len(self.edges)
+
+    @property
+    def max_depth(self) -> int:
+        if self._max_depth is None:
+            self._max_depth = self._calculate_max_depth()
+        return self._max_depth
+
+
+    def _ensure_index(self):
+        """Build the dense traversal index on first use
+
+        Maps every node id to a consecutive int and pre-resolves each
+        node's calls to child indices, so the traversals below work on
+        flat arrays (index loads/stores) instead of hashing id strings.
+        Dangling call targets are filtered here, but nodes whose calls
+        are all dangling still count as non-leaves, matching the
+        id-based traversal semantics.
+        """
+        if self._node_index is None:
+            index = {node_id: i for i, node_id in enumerate(self.nodes)}
+            self._node_index = index
+            self._index_ids = list(self.nodes)
+            self._adjacency = [
+                [index[called_id] for called_id in node.calls if called_id in index]
+                for node in self.nodes.values()
+            ]
+            self._is_leaf = [not node.calls for node in self.nodes.values()]
+        return self._node_index, self._index_ids, self._adjacency, self._is_leaf
+
     def _calculate_max_depth(self) -> int:
-        """Calculate maximum call chain depth"""
+        """Calculate maximum call chain depth
+
+        Iterative post-order DFS over the dense index with a shared
+        memo: each node's longest downward chain is computed exactly
+        once across all entry points. Back-edges (cycles) are detected
+        with an on-stack marker and contribute no further depth.
+        """
         if not self.entry_points:
             return 0
-        
-        max_depth = 0
+
+        index, _ids, adjacency, _is_leaf = self._ensure_index()
+        n = len(adjacency)
+        depth = [-1] * n  # -1 = not yet computed
+        on_stack = bytearray(n)
+
+        for entry_id in self.entry_points:
+            start = index.get(entry_id)
+            if start is None or depth[start] >= 0:
+                continue
+
+            # Two-phase stack: enter pushes children, exit folds their
+            # memoized depths into the parent's
+            stack = [(start, False)]
+            while stack:
+                idx, exiting = stack.pop()
+
+                if exiting:
+                    on_stack[idx] = 0
+                    best = 0
+                    for child in adjacency[idx]:
+                        child_depth = depth[child]
+                        if child_depth >= best:
+                            best = child_depth + 1
+                    depth[idx] = best
+                    continue
+
+                if depth[idx] >= 0 or on_stack[idx]:
+                    continue
+
+                children = adjacency[idx]
+                if not children:
+                    # Leaf fast path: no exit phase needed
+                    depth[idx] = 0
+                    continue
+
+                on_stack[idx] = 1
+                stack.append((idx, True))
+                for child in children:
+                    stack.append((child, False))
+
+        best = 0
         for entry_id in self.entry_points:
-            depth = self._dfs_depth(entry_id, visited=set())
-            max_depth = max(max_depth, depth)
-        return max_depth
-    
-    def _dfs_depth(self, node_id: str, visited: Set[str], depth: int = 0) -> int:
-        """DFS to find maximum depth from a node"""
-        if node_id in visited or node_id not in self.nodes:
-            return depth
-        
-        visited.add(node_id)
-        node = self.nodes[node_id]
-        
-        if not node.calls:
-            return depth
-        
-        max_child_depth = depth
-        for called_id in node.calls:
-            child_depth = self._dfs_depth(called_id, visited.copy(), depth + 1)
-            max_child_depth = max(max_child_depth, child_depth)
-        
-        return max_child_depth
-    
-    def get_call_chain(self, entry_id: str, max_depth: int = 10) -> List[List[str]]:
+            idx = index.get(entry_id)
+            if idx is not None and depth[idx] > best:
+                best = depth[idx]
+        return best
+    
+    def get_call_chain(self, entry_id: str, max_depth: int = 10) -> List[Tuple[str, ...]]:
         """
         Get all call chains from an entry point
-        
+
         Returns:
-            List of chains, where each chain is a list of node IDs
+            List of chains, where each chain is a tuple of node IDs
         """
+        index, ids, adjacency, is_leaf = self._ensure_index()
+        start = index.get(entry_id)
+        if start is None:
+            return []
+
         chains = []
-        
-        def dfs(node_id: str, chain: List[str], visited: Set[str]):
-            if len(chain) > max_depth or node_id in visited:
-                return
-            
-            if node_id not in self.nodes:
-                return
-            
-            visited.add(node_id)
-            chain.append(node_id)
-            node = self.nodes[node_id]
-            
-            if not node.calls:
-                # Leaf node - save chain
-                chains.append(chain.copy())
+
+        # Iterative backtracking DFS on the dense index: the chain and
+        # the byte-array visited marks are mutated in place (set on
+        # entry, cleared on exit), so the only allocation per path is
+        # the id snapshot taken when a leaf completes a chain
+        chain: List[int] = []
+        visited = bytearray(len(ids))
+        stack: List[tuple] = [(start, False)]
+        while stack:
+            idx, exiting = stack.pop()
+
+            if exiting:
+                # Backtrack: undo this node's entry
+                chain.pop()
+                visited[idx] = 0
+                continue
+
+            if len(chain) > max_depth or visited[idx]:
+                continue
+
+            visited[idx] = 1
+            chain.append(idx)
+            stack.append((idx, True))
+
+            if is_leaf[idx]:
+                # Leaf node - snapshot the completed chain as an id
+                # tuple: immutable, shareable and exactly sized (no
+                # list over-allocation per emitted chain)
+                chains.append(tuple([ids[i] for i in chain]))
             else:
-                for called_id in node.calls:
-                    dfs(called_id, chain.copy(), visited.copy())
-        
-        dfs(entry_id, [], set())
+                for child in adjacency[idx]:
+                    stack.append((child, False))
+
         return chains
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict"""
         return {
-            'nodes': {node_id: node.to_dict() for node_id, node in self.nodes.items()},
+            # Keys duplicate node.id, so iterating values() skips the
+            # per-item key/value tuple unpacking of items()
+            'nodes': {node.id: node.to_dict() for node in self.nodes.values()},
             'edges': [edge.to_dict() for edge in self.edges],
             'entry_points': self.entry_points,
             'total_nodes': self.total_nodes,
@@ -283,23 +403,99 @@ class CallGraph:
             'max_depth': self.max_depth
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CallGraph':
+        """Deserialize from dict"""
+        return cls(
+            nodes={
+                node_id: CodeNode.from_dict(node_data)
+                for node_id, node_data in data.get('nodes', {}).items()
+            },
+            edges=[CallEdge(**edge) for edge in data.get('edges', [])],
+            entry_points=data.get('entry_points', [])
+        )
+
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string
+
+        One json.dumps call over the prebuilt dict with minimal
+        separators - noticeably smaller and faster than pretty-printed
+        output for graphs with thousands of nodes.
+        """
+        return json.dumps(self.to_dict(), separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, payload: str) -> 'CallGraph':
+        """Deserialize from a JSON string produced by to_json"""
+        return cls.from_dict(json.loads(payload))
+
+    def write_json(self, fp) -> None:
+        """Stream the graph as compact JSON to a text file object
+
+        Emits one node/edge at a time, so peak memory stays at a single
+        element's dict instead of the fully nested graph dict that
+        to_dict builds - the difference matters when dumping graphs with
+        tens of thousands of nodes to disk. Output is byte-identical to
+        json.dumps(self.to_dict(), separators=(',', ':')).
+        """
+        dumps = json.dumps
+        write = fp.write
+
+        write('{"nodes":{')
+        first = True
+        for node in self.nodes.values():
+            if first:
+                first = False
+            else:
+                write(',')
+            write(dumps(node.id))
+            write(':')
+            write(dumps(node.to_dict(), separators=(',', ':')))
+
+        write('},"edges":[')
+        first = True
+        for edge in self.edges:
+            if first:
+                first = False
+            else:
+                write(',')
+            write(dumps(edge.to_dict(), separators=(',', ':')))
+
+        write('],"entry_points":')
+        write(dumps(self.entry_points, separators=(',', ':')))
+        write(',"total_nodes":%d,"total_edges":%d,"max_depth":%d}'
+              % (self.total_nodes, self.total_edges, self.max_depth))
+
     def to_dot(self) -> str:
-        """Export to GraphViz DOT format for visualization"""
-        lines = ['digraph CallGraph {']
-        lines.append('  rankdir=LR;')
-        lines.append('  node [shape=box, style=rounded];')
-        
+        """Export to GraphViz DOT format for visualization
+
+        Built as list comprehensions feeding a single join - no repeated
+        append calls or per-line f-string evaluation in the edge loop,
+        which dominates export time on large graphs.
+        """
+        nodes = self.nodes
+
+        lines = [
+            'digraph CallGraph {',
+            '  rankdir=LR;',
+            '  node [shape=box, style=rounded];',
+        ]
+
         # Entry points in green
-        for entry_id in self.entry_points:
-            if entry_id in self.nodes:
-                name = self.nodes[entry_id].name
-                lines.append(f'  "{entry_id}" [label="{name}", fillcolor=lightgreen, style=filled];')
-        
+        lines.extend(
+            '  "%s" [label="%s", fillcolor=lightgreen, style=filled];'
+            % (entry_id, nodes[entry_id].name)
+            for entry_id in self.entry_points if entry_id in nodes
+        )
+
         # Edges
-        for edge in self.edges:
-            style = "solid" if edge.call_type == "direct" else "dashed"
-            lines.append(f'  "{edge.source}" -> "{edge.target}" [style={style}];')
-        
+        lines.extend(
+            '  "%s" -> "%s" [style=%s];'
+            % (edge.source, edge.target,
+               'solid' if edge.call_type == 'direct' else 'dashed')
+            for edge in self.edges
+        )
+
         lines.append('}')
         return '\n'.join(lines)
 
@@ -308,7 +504,7 @@ class CallGraph:
 # Level & Challenge Models
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class Level:
     """
     Represents a learning level/challenge
@@ -356,7 +552,7 @@ class Level:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Challenge:
     """Individual challenge within a level"""
     
@@ -366,7 +562,12 @@ class Challenge:
     answer: Dict[str, Any]  # Expected answer
     hints: List[str] = field(default_factory=list)
     points: int = 10
-    
+
+    # Evaluator-side cache of normalized answer fields; filled lazily
+    _normalized_answers: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
@@ -382,7 +583,7 @@ class Challenge:
 # Project Analysis Result
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     Complete analysis result for a project
@@ -422,6 +623,50 @@ class AnalysisResult:
             'warnings': self.warnings
         }
 
+    def to_json(self) -> str:
+        """Serialize the full result to a compact JSON string"""
+        return json.dumps(self.to_dict(), separators=(',', ':'))
+
+    def write_json(self, fp) -> None:
+        """Stream the full result as compact JSON to a text file object
+
+        Delegates the call graph - by far the largest section - to
+        CallGraph.write_json, so the encoder never holds the complete
+        nested result dict in memory. Output is byte-identical to
+        to_json().
+        """
+        dumps = json.dumps
+        write = fp.write
+
+        write('{"project_id":')
+        write(dumps(self.project_id))
+        write(',"language":')
+        write(dumps(self.language.value))
+        write(',"call_graph":')
+        self.call_graph.write_json(fp)
+
+        write(',"levels":[')
+        first = True
+        for level in self.levels:
+            if first:
+                first = False
+            else:
+                write(',')
+            write(dumps(level.to_dict(), separators=(',', ':')))
+
+        write('],"analyzed_at":')
+        write(dumps(self.analyzed_at.isoformat()))
+        write(',"analysis_time":%s,"files_analyzed":%d,"lines_of_code":%d'
+              % (dumps(self.analysis_time), self.files_analyzed,
+                 self.lines_of_code))
+        write(',"is_valid":')
+        write(dumps(self.is_valid))
+        write(',"errors":')
+        write(dumps(self.errors, separators=(',', ':')))
+        write(',"warnings":')
+        write(dumps(self.warnings, separators=(',', ':')))
+        write('}')
+
 
 # ============================================
 # Example Usage
@@ -474,6 +719,15 @@ if __name__ == '__main__':
     print(f"  Nodes: {graph.total_nodes}")
     print(f"  Edges: {graph.total_edges}")
     print(f"  Max depth: {graph.max_depth}")
+
+    # Round-trip: decoding our own encoding must reproduce it exactly,
+    # including nodes with typed parameters
+    restored = CallGraph.from_json(graph.to_json())
+    assert restored.to_json() == graph.to_json()
+    restored_params = restored.nodes[node.id].parameters
+    assert [(p.name, p.type_hint, p.default_value) for p in restored_params] == \
+           [(p.name, p.type_hint, p.default_value) for p in node.parameters]
+    print(f"  JSON round-trip: OK")
     
     print("\n" + "="*60)
     print("✓ Data models are fully functional!")
@@ -5,15 +5,117 @@ Manages achievement unlocking, tracking, and rewards.
 Checks user actions against achievement conditions and awards badges.
 """
 
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional
 
 from app.services.models import Achievement, AchievementCategory, UserStats
 from app.services.achievements.default_achievements import (
-    DEFAULT_ACHIEVEMENTS, get_achievement_by_id, get_all_achievements
+    DEFAULT_ACHIEVEMENTS, ACHIEVEMENTS_BY_ID, achievements_unlocked_by,
+    get_achievement_by_id, get_all_achievements
 )
 
 
+# ============================================
+# Condition checkers
+# ============================================
+# One small function per condition type, dispatched through a dict:
+# a single hash lookup per achievement instead of walking a 13-branch
+# elif chain on every event.
+
+def _check_levels_completed(achievement, user_stats, event_type, event_data, now):
+    return user_stats.levels_completed >= achievement.condition.get("count", 0)
+
+
+def _check_projects_completed(achievement, user_stats, event_type, event_data, now):
+    return user_stats.projects_completed >= achievement.condition.get("count", 0)
+
+
+def _check_perfect_scores(achievement, user_stats, event_type, event_data, now):
+    return user_stats.perfect_scores >= achievement.condition.get("count", 0)
+
+
+def _check_fast_completion(achievement, user_stats, event_type, event_data, now):
+    if event_type == "level_completed":
+        time_taken = event_data.get("time_taken", float('inf'))
+        return time_taken <= achievement.condition.get("time", 0)
+    return False
+
+
+def _check_streak(achievement, user_stats, event_type, event_data, now):
+    return user_stats.current_streak >= achievement.condition.get("days", 0)
+
+
+def _check_early_completion(achievement, user_stats, event_type, event_data, now):
+    if event_type == "level_completed":
+        completion_time = event_data.get("completed_at") or now
+        return completion_time.hour < achievement.condition.get("hour", 24)
+    return False
+
+
+def _check_late_completion(achievement, user_stats, event_type, event_data, now):
+    if event_type == "level_completed":
+        completion_time = event_data.get("completed_at") or now
+        return completion_time.hour >= achievement.condition.get("hour", 0)
+    return False
+
+
+def _check_difficulty_level(achievement, user_stats, event_type, event_data, now):
+    if event_type == "level_completed":
+        difficulty = event_data.get("difficulty", "")
+        return difficulty == achievement.condition.get("difficulty", "")
+    return False
+
+
+def _check_untracked(achievement, user_stats, event_type, event_data, now):
+    """Condition types that need separate tracking - simplified for MVP"""
+    return False
+
+
+# Condition types that can only ever fire on a "level_completed" event;
+# any other event skips their achievements entirely
+_LEVEL_EVENT_ONLY_TYPES = frozenset({
+    "fast_completion", "early_completion", "late_completion",
+    "difficulty_level",
+})
+
+# Count-threshold condition types; each names the UserStats field that
+# drives it. These are resolved through the sorted threshold arrays in
+# default_achievements rather than the per-achievement checkers.
+_COUNT_CONDITION_TYPES = ("levels_completed", "projects_completed", "perfect_scores")
+
+# Candidate lists filtered once at import; the count-threshold types
+# are excluded because check_achievements resolves them via binary
+# search instead of a per-achievement scan
+_EVENT_CANDIDATES = [
+    achievement for achievement in DEFAULT_ACHIEVEMENTS
+    if achievement.condition.get("type") not in _COUNT_CONDITION_TYPES
+]
+_NON_LEVEL_EVENT_CANDIDATES = [
+    achievement for achievement in _EVENT_CANDIDATES
+    if achievement.condition.get("type") not in _LEVEL_EVENT_ONLY_TYPES
+]
+
+_CONDITION_CHECKERS: Dict[str, Callable] = {
+    # Progression achievements
+    "levels_completed": _check_levels_completed,
+    "projects_completed": _check_projects_completed,
+    # Performance achievements
+    "perfect_scores": _check_perfect_scores,
+    "fast_completion": _check_fast_completion,
+    "fast_completions": _check_untracked,
+    "first_attempts": _check_untracked,
+    # Special achievements
+    "mini_projects": _check_untracked,
+    "streak": _check_streak,
+    "early_completion": _check_early_completion,
+    "late_completion": _check_late_completion,
+    "weekend_levels": _check_untracked,
+    "difficulty_level": _check_difficulty_level,
+}
+
+
 class AchievementService:
     """
     Service for managing achievements
@@ -28,7 +130,9 @@ class AchievementService:
     def __init__(self):
         # In-memory storage (would be database in production)
         self._user_achievements: Dict[str, Set[str]] = {}  # user_id -> set of achievement_ids
-        self._achievement_unlock_times: Dict[str, datetime] = {}  # "user:achievement" -> datetime
+        # user_id -> {achievement_id -> unlock time}; nested dicts avoid
+        # allocating and hashing an f"{user}:{achievement}" key per access
+        self._unlock_times: Dict[str, Dict[str, datetime]] = {}
     
     def check_achievements(
         self,
@@ -51,19 +155,46 @@ class AchievementService:
         """
         if event_data is None:
             event_data = {}
-        
+
+        # One clock read for the whole sweep - shared by the time-based
+        # condition checks and recorded as the unlock time
+        now = datetime.now()
+
         newly_unlocked = []
-        
-        for achievement in DEFAULT_ACHIEVEMENTS:
+
+        # Resolve the user's unlocked set once for the whole sweep
+        unlocked = self._user_achievements.get(user_id) or ()
+
+        # Count-threshold types: two binary searches per type find
+        # every satisfied achievement at once instead of running a
+        # predicate per achievement
+        for condition_type in _COUNT_CONDITION_TYPES:
+            count = getattr(user_stats, condition_type)
+            for achievement_id in achievements_unlocked_by(condition_type, count):
+                if achievement_id in unlocked:
+                    continue
+                achievement = ACHIEVEMENTS_BY_ID[achievement_id]
+                self._unlock_achievement(user_id, achievement_id, now)
+                newly_unlocked.append(achievement)
+
+        # Only level-completion events can trigger the event-bound
+        # condition types, so other events check a pre-filtered subset
+        if event_type == "level_completed":
+            candidates = _EVENT_CANDIDATES
+        else:
+            candidates = _NON_LEVEL_EVENT_CANDIDATES
+
+        for achievement in candidates:
             # Skip if already unlocked
-            if self.is_unlocked(user_id, achievement.id):
+            if achievement.id in unlocked:
                 continue
-            
+
             # Check if conditions are met
-            if self._check_condition(achievement, user_stats, event_type, event_data):
-                self._unlock_achievement(user_id, achievement.id)
+            if self._check_condition(achievement, user_stats, event_type,
+                                     event_data, now):
+                self._unlock_achievement(user_id, achievement.id, now)
                 newly_unlocked.append(achievement)
-        
+
         return newly_unlocked
     
     def _check_condition(
@@ -71,95 +202,51 @@ class AchievementService:
         achievement: Achievement,
         user_stats: UserStats,
         event_type: str,
-        event_data: Dict
+        event_data: Dict,
+        now: Optional[datetime] = None
     ) -> bool:
         """
         Check if achievement condition is met
-        
+
         Args:
             achievement: Achievement to check
             user_stats: User statistics
             event_type: Event type
             event_data: Event data
-        
+            now: Current time, shared across a check sweep
+
         Returns:
             True if condition met, False otherwise
         """
-        condition = achievement.condition
-        condition_type = condition.get("type")
-        
-        # Progression achievements
-        if condition_type == "levels_completed":
-            return user_stats.levels_completed >= condition.get("count", 0)
-        
-        elif condition_type == "projects_completed":
-            return user_stats.projects_completed >= condition.get("count", 0)
-        
-        # Performance achievements
-        elif condition_type == "perfect_scores":
-            return user_stats.perfect_scores >= condition.get("count", 0)
-        
-        elif condition_type == "fast_completion":
-            if event_type == "level_completed":
-                time_taken = event_data.get("time_taken", float('inf'))
-                return time_taken <= condition.get("time", 0)
+        checker = _CONDITION_CHECKERS.get(achievement.condition.get("type"))
+        if checker is None:
             return False
-        
-        elif condition_type == "fast_completions":
-            # Would need to track this separately in production
-            return False  # Simplified for MVP
-        
-        elif condition_type == "first_attempts":
-            # Would need to track this separately in production
-            return False  # Simplified for MVP
-        
-        # Special achievements
-        elif condition_type == "mini_projects":
-            # Would check mini_projects_completed in production
-            return False  # Simplified for MVP
-        
-        elif condition_type == "streak":
-            return user_stats.current_streak >= condition.get("days", 0)
-        
-        elif condition_type == "early_completion":
-            if event_type == "level_completed":
-                completion_time = event_data.get("completed_at", datetime.now())
-                return completion_time.hour < condition.get("hour", 24)
-            return False
-        
-        elif condition_type == "late_completion":
-            if event_type == "level_completed":
-                completion_time = event_data.get("completed_at", datetime.now())
-                return completion_time.hour >= condition.get("hour", 0)
-            return False
-        
-        elif condition_type == "weekend_levels":
-            # Would need separate tracking
-            return False  # Simplified for MVP
-        
-        elif condition_type == "difficulty_level":
-            if event_type == "level_completed":
-                difficulty = event_data.get("difficulty", "")
-                return difficulty == condition.get("difficulty", "")
-            return False
-        
-        return False
+        if now is None:
+            now = datetime.now()
+        return checker(achievement, user_stats, event_type, event_data, now)
     
-    def _unlock_achievement(self, user_id: str, achievement_id: str) -> None:
+    def _unlock_achievement(
+        self,
+        user_id: str,
+        achievement_id: str,
+        now: Optional[datetime] = None
+    ) -> None:
         """
         Unlock an achievement for a user
-        
+
         Args:
             user_id: User identifier
             achievement_id: Achievement identifier
+            now: Unlock time; defaults to the current time
         """
         if user_id not in self._user_achievements:
             self._user_achievements[user_id] = set()
-        
+
         self._user_achievements[user_id].add(achievement_id)
-        
-        key = f"{user_id}:{achievement_id}"
-        self._achievement_unlock_times[key] = datetime.now()
+
+        if now is None:
+            now = datetime.now()
+        self._unlock_times.setdefault(user_id, {})[achievement_id] = now
     
     def is_unlocked(self, user_id: str, achievement_id: str) -> bool:
         """
@@ -184,20 +271,22 @@ class AchievementService:
         Returns:
             List of unlocked achievements with unlock times
         """
-        unlocked_ids = self._user_achievements.get(user_id, set())
-        
+        unlock_times = self._unlock_times.get(user_id)
+        if not unlock_times:
+            return []
+
+        # Unlocks are appended in chronological order, so walking the
+        # insertion-ordered dict backwards yields newest-first without a
+        # sort. replace() returns per-user copies instead of stamping
+        # unlocked_at onto the shared default Achievement instances.
         achievements = []
-        for achievement_id in unlocked_ids:
-            achievement = get_achievement_by_id(achievement_id)
+        for achievement_id in reversed(unlock_times):
+            achievement = ACHIEVEMENTS_BY_ID.get(achievement_id)
             if achievement:
-                # Set unlock time
-                key = f"{user_id}:{achievement_id}"
-                achievement.unlocked_at = self._achievement_unlock_times.get(key)
-                achievements.append(achievement)
-        
-        # Sort by unlock time (newest first)
-        achievements.sort(key=lambda a: a.unlocked_at or datetime.min, reverse=True)
-        
+                achievements.append(
+                    replace(achievement, unlocked_at=unlock_times[achievement_id])
+                )
+
         return achievements
     
     def get_unlockable_achievements(
@@ -283,22 +372,23 @@ class AchievementService:
         """
         unlocked = self._user_achievements.get(user_id, set())
         total = len(DEFAULT_ACHIEVEMENTS)
-        
-        # Count by category
-        by_category = {}
+
+        # Single pass: category totals, unlocked-per-category and the XP
+        # sum all come from the same sweep over the achievement list
+        totals = Counter()
+        unlocked_counts = Counter()
+        total_achievement_xp = 0
         for achievement in DEFAULT_ACHIEVEMENTS:
             category = achievement.category.value
-            by_category.setdefault(category, {"total": 0, "unlocked": 0})
-            by_category[category]["total"] += 1
+            totals[category] += 1
             if achievement.id in unlocked:
-                by_category[category]["unlocked"] += 1
-        
-        # Calculate total XP from achievements
-        total_achievement_xp = sum(
-            get_achievement_by_id(aid).xp_reward
-            for aid in unlocked
-            if get_achievement_by_id(aid)
-        )
+                unlocked_counts[category] += 1
+                total_achievement_xp += achievement.xp_reward
+
+        by_category = {
+            category: {"total": count, "unlocked": unlocked_counts[category]}
+            for category, count in totals.items()
+        }
         
         return {
             "total_achievements": total,
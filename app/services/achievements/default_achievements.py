@@ -4,6 +4,9 @@ Achievement System - Default Achievements Definition
 Predefined achievements that users can unlock through gameplay.
 """
 
+from bisect import bisect_right
+from typing import Sequence
+
 from app.services.models import Achievement, AchievementCategory
 
 # All available achievements
@@ -202,19 +205,83 @@ DEFAULT_ACHIEVEMENTS = [
 ]
 
 
+# Lookup indexes, built once at import. Services check achievements on
+# every gameplay event, so id and condition-type lookups must be O(1)
+# instead of linear scans over DEFAULT_ACHIEVEMENTS.
+ACHIEVEMENTS_BY_ID: dict[str, Achievement] = {
+    achievement.id: achievement for achievement in DEFAULT_ACHIEVEMENTS
+}
+
+ACHIEVEMENTS_BY_CONDITION_TYPE: dict[str, list[Achievement]] = {}
+for _achievement in DEFAULT_ACHIEVEMENTS:
+    ACHIEVEMENTS_BY_CONDITION_TYPE.setdefault(
+        _achievement.condition.get("type", ""), []
+    ).append(_achievement)
+del _achievement
+
+_category_buckets: dict[AchievementCategory, list[Achievement]] = {}
+for _achievement in DEFAULT_ACHIEVEMENTS:
+    _category_buckets.setdefault(_achievement.category, []).append(_achievement)
+del _achievement
+
+# Frozen so every lookup returns the same shared tuple
+ACHIEVEMENTS_BY_CATEGORY: dict[AchievementCategory, tuple[Achievement, ...]] = {
+    category: tuple(bucket) for category, bucket in _category_buckets.items()
+}
+del _category_buckets
+
+ALL_ACHIEVEMENTS: tuple[Achievement, ...] = tuple(DEFAULT_ACHIEVEMENTS)
+
+# Count-threshold conditions laid out as parallel sorted tuples
+# (thresholds, ids) per condition type, so a checker can find every
+# achievement crossed by a counter bump with two binary searches
+# instead of scanning the condition dicts.
+_COUNT_CONDITION_TYPES = ("levels_completed", "projects_completed", "perfect_scores")
+
+PROGRESSION_THRESHOLDS: dict[str, tuple[tuple[int, ...], tuple[str, ...]]] = {}
+for _type in _COUNT_CONDITION_TYPES:
+    _pairs = sorted(
+        (achievement.condition["count"], achievement.id)
+        for achievement in ACHIEVEMENTS_BY_CONDITION_TYPE.get(_type, ())
+    )
+    PROGRESSION_THRESHOLDS[_type] = (
+        tuple(threshold for threshold, _ in _pairs),
+        tuple(achievement_id for _, achievement_id in _pairs),
+    )
+del _type, _pairs
+
+
+def achievements_unlocked_by(
+    condition_type: str, new_count: int, old_count: int = 0
+) -> Sequence[str]:
+    """
+    IDs of count-based achievements crossed by a counter increase
+
+    Args:
+        condition_type: One of the count-threshold condition types
+        new_count: Counter value after the update
+        old_count: Counter value before the update
+
+    Returns:
+        Achievement IDs with old_count < threshold <= new_count
+    """
+    entry = PROGRESSION_THRESHOLDS.get(condition_type)
+    if entry is None:
+        return ()
+    thresholds, achievement_ids = entry
+    return achievement_ids[bisect_right(thresholds, old_count):bisect_right(thresholds, new_count)]
+
+
 def get_achievement_by_id(achievement_id: str) -> Achievement:
     """Get achievement by ID"""
-    for achievement in DEFAULT_ACHIEVEMENTS:
-        if achievement.id == achievement_id:
-            return achievement
-    return None
+    return ACHIEVEMENTS_BY_ID.get(achievement_id)
 
 
-def get_achievements_by_category(category: AchievementCategory) -> list[Achievement]:
+def get_achievements_by_category(category: AchievementCategory) -> Sequence[Achievement]:
     """Get all achievements in a category"""
-    return [a for a in DEFAULT_ACHIEVEMENTS if a.category == category]
+    return ACHIEVEMENTS_BY_CATEGORY.get(category, ())
 
 
-def get_all_achievements() -> list[Achievement]:
+def get_all_achievements() -> Sequence[Achievement]:
     """Get all available achievements"""
-    return DEFAULT_ACHIEVEMENTS.copy()
+    return ALL_ACHIEVEMENTS
@@ -5,13 +5,128 @@ Automatic grading system for different challenge types.
 Provides immediate feedback and partial credit where appropriate.
 """
 
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import takewhile
+from typing import Callable, ClassVar, Dict, List, Any, Optional
 import re
 
 from app.models.core import Challenge, ChallengeType, Level
 from app.services.models import ChallengeResult, LevelResult
 
 
+# Compiled once at import - evaluation normalizes strings for every
+# fill-blank and code challenge, and calling .sub() on the compiled
+# pattern skips the re-module cache lookup each time
+_WS_RE = re.compile(r'\s+')
+_COMMENT_RE = re.compile(r'#.*$', re.MULTILINE)
+_TOKEN_RE = re.compile(r'\w+')
+
+# Shared sentinel for the correct-answer path; avoids allocating an
+# empty list per result
+_EMPTY_HINTS: tuple = ()
+
+# Constant feedback strings reused across evaluators
+_FB_CORRECT = "✅ Correct!"
+_FB_NO_ANSWER = "No correct answer defined"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_code(code: str) -> str:
+    """
+    Normalize code for comparison
+
+    Memoized: the expected-solution side is identical across every
+    attempt at a challenge, and users resubmitting the same code on
+    retries hit the cache too.
+
+    Args:
+        code: Source code
+
+    Returns:
+        Normalized code
+    """
+    # Remove comments
+    code = _COMMENT_RE.sub('', code)
+
+    # Normalize whitespace
+    code = _WS_RE.sub(' ', code)
+
+    return code.strip().lower()
+
+
+def _normalized_answer(challenge: Challenge, key: str) -> str:
+    """
+    Normalized (stripped, lowercased) form of a static answer field
+
+    The correct answer never changes for a given challenge, so the
+    normalized form is stashed on the challenge on first access and
+    reused across all subsequent attempts.
+
+    Args:
+        challenge: Challenge definition
+        key: Key into challenge.answer
+
+    Returns:
+        Normalized answer string
+    """
+    cache = challenge._normalized_answers
+    if cache is None:
+        cache = challenge._normalized_answers = {}
+    value = cache.get(key)
+    if value is None:
+        value = challenge.answer.get(key, "").strip().lower()
+        cache[key] = value
+    return value
+
+
+def _stripped_answer(challenge: Challenge, key: str) -> str:
+    """
+    Stripped (original case) form of a static answer field
+
+    Shares the per-challenge cache with _normalized_answer; both treat
+    challenge.answer as immutable after the first evaluation.
+
+    Args:
+        challenge: Challenge definition
+        key: Key into challenge.answer
+
+    Returns:
+        Stripped answer string
+    """
+    cache = challenge._normalized_answers
+    if cache is None:
+        cache = challenge._normalized_answers = {}
+    cache_key = 'strip:' + key
+    value = cache.get(cache_key)
+    if value is None:
+        value = challenge.answer.get(key, "").strip()
+        cache[cache_key] = value
+    return value
+
+
+def _chain_display(challenge: Challenge, correct_chain: List[str]) -> str:
+    """
+    Arrow-joined rendering of the correct call chain
+
+    Joined once per challenge and reused in the perfect-trace and
+    incorrect feedback across attempts.
+
+    Args:
+        challenge: Challenge definition
+        correct_chain: The expected call chain
+
+    Returns:
+        Chain joined with arrows
+    """
+    cache = challenge._normalized_answers
+    if cache is None:
+        cache = challenge._normalized_answers = {}
+    display = cache.get('chain_display')
+    if display is None:
+        display = cache['chain_display'] = ' → '.join(correct_chain)
+    return display
+
+
 class ChallengeEvaluator:
     """
     Evaluates user answers for different challenge types
@@ -24,7 +139,10 @@ class ChallengeEvaluator:
     - Debugging (pattern matching)
     - Architecture (multiple choice variant)
     """
-    
+
+    # The evaluator is stateless; no instance __dict__ needed
+    __slots__ = ()
+
     def evaluate_challenge(
         self,
         challenge: Challenge,
@@ -40,26 +158,16 @@ class ChallengeEvaluator:
         Returns:
             ChallengeResult with score and feedback
         """
-        if challenge.type == ChallengeType.MULTIPLE_CHOICE:
-            return self._evaluate_multiple_choice(challenge, user_answer)
-        elif challenge.type == ChallengeType.CODE_TRACING:
-            return self._evaluate_code_tracing(challenge, user_answer)
-        elif challenge.type == ChallengeType.FILL_BLANK:
-            return self._evaluate_fill_blank(challenge, user_answer)
-        elif challenge.type == ChallengeType.CODE_COMPLETION:
-            return self._evaluate_code_completion(challenge, user_answer)
-        elif challenge.type == ChallengeType.DEBUGGING:
-            return self._evaluate_debugging(challenge, user_answer)
-        elif challenge.type == ChallengeType.ARCHITECTURE:
-            return self._evaluate_architecture(challenge, user_answer)
-        else:
-            return ChallengeResult(
-                challenge_id=challenge.id,
-                is_correct=False,
-                points_earned=0,
-                max_points=challenge.points,
-                feedback="Unknown challenge type"
-            )
+        evaluator = self._EVALUATORS.get(challenge.type)
+        if evaluator is not None:
+            return evaluator(self, challenge, user_answer)
+        return ChallengeResult(
+            challenge_id=challenge.id,
+            is_correct=False,
+            points_earned=0,
+            max_points=challenge.points,
+            feedback="Unknown challenge type"
+        )
     
     def _evaluate_multiple_choice(
         self,
@@ -73,14 +181,14 @@ class ChallengeEvaluator:
         Expected challenge.answer format: {"correct": "correct_option"}
         """
         user_selection = user_answer.get("answer", "").strip()
-        correct_answer = challenge.answer.get("correct", "").strip()
-        
-        is_correct = user_selection.lower() == correct_answer.lower()
-        
+
+        is_correct = user_selection.lower() == _normalized_answer(challenge, "correct")
+
         if is_correct:
-            feedback = "✅ Correct!"
+            feedback = _FB_CORRECT
             points = challenge.points
         else:
+            correct_answer = _stripped_answer(challenge, "correct")
             feedback = f"❌ Incorrect. The correct answer is: {correct_answer}"
             points = 0
         
@@ -90,7 +198,7 @@ class ChallengeEvaluator:
             points_earned=points,
             max_points=challenge.points,
             feedback=feedback,
-            hints=challenge.hints if not is_correct else []
+            hints=challenge.hints if not is_correct else _EMPTY_HINTS
         )
     
     def _evaluate_code_tracing(
@@ -113,29 +221,29 @@ class ChallengeEvaluator:
                 is_correct=False,
                 points_earned=0,
                 max_points=challenge.points,
-                feedback="No correct answer defined"
+                feedback=_FB_NO_ANSWER
             )
         
-        # Calculate how many functions are correct in sequence
-        correct_count = 0
-        for i, func in enumerate(user_trace):
-            if i < len(correct_chain) and func == correct_chain[i]:
-                correct_count += 1
-            else:
-                break  # Stop at first mismatch
-        
+        # Length of the matching prefix; zip truncates to the shorter
+        # sequence and takewhile stops at the first mismatch
+        correct_count = sum(
+            1 for _ in takewhile(
+                lambda pair: pair[0] == pair[1], zip(user_trace, correct_chain)
+            )
+        )
+
         # Award partial credit
         percentage = correct_count / len(correct_chain) if correct_chain else 0
         points = int(challenge.points * percentage)
         is_correct = correct_count == len(correct_chain)
         
         if is_correct:
-            feedback = f"✅ Perfect trace! Complete execution flow: {' → '.join(correct_chain)}"
+            feedback = f"✅ Perfect trace! Complete execution flow: {_chain_display(challenge, correct_chain)}"
         elif correct_count > 0:
             feedback = f"⚠️ Partially correct ({correct_count}/{len(correct_chain)} steps). "
             feedback += f"You got up to: {' → '.join(user_trace[:correct_count])}"
         else:
-            feedback = f"❌ Incorrect. The execution flow is: {' → '.join(correct_chain)}"
+            feedback = f"❌ Incorrect. The execution flow is: {_chain_display(challenge, correct_chain)}"
         
         return ChallengeResult(
             challenge_id=challenge.id,
@@ -143,7 +251,7 @@ class ChallengeEvaluator:
             points_earned=points,
             max_points=challenge.points,
             feedback=feedback,
-            hints=challenge.hints if not is_correct else []
+            hints=challenge.hints if not is_correct else _EMPTY_HINTS
         )
     
     def _evaluate_fill_blank(
@@ -160,13 +268,13 @@ class ChallengeEvaluator:
         # Handle single fill
         if "fill" in user_answer:
             user_fill = user_answer["fill"].strip()
-            correct_fill = challenge.answer.get("fill", "").strip()
+            correct_fill = _stripped_answer(challenge, "fill")
             
             # Flexible matching (case-insensitive, whitespace-agnostic)
             is_correct = self._flexible_match(user_fill, correct_fill)
             
             if is_correct:
-                feedback = "✅ Correct!"
+                feedback = _FB_CORRECT
                 points = challenge.points
             else:
                 feedback = f"❌ Incorrect. The answer is: {correct_fill}"
@@ -183,15 +291,19 @@ class ChallengeEvaluator:
                     is_correct=False,
                     points_earned=0,
                     max_points=challenge.points,
-                    feedback="No correct answer defined"
+                    feedback=_FB_NO_ANSWER
                 )
             
-            # Count correct fills
-            correct_count = 0
-            for key, correct_value in correct_fills.items():
-                user_value = user_fills.get(key, "")
-                if self._flexible_match(user_value, correct_value):
-                    correct_count += 1
+            # Normalize both sides once, then count matches with plain
+            # dict lookups instead of a _flexible_match call per blank
+            user_norm = {
+                key: ''.join(value.lower().split())
+                for key, value in user_fills.items()
+            }
+            correct_count = sum(
+                1 for key, value in correct_fills.items()
+                if user_norm.get(key, '') == ''.join(value.lower().split())
+            )
             
             # Award partial credit
             percentage = correct_count / len(correct_fills)
@@ -209,7 +321,7 @@ class ChallengeEvaluator:
             points_earned=points,
             max_points=challenge.points,
             feedback=feedback,
-            hints=challenge.hints if not is_correct else []
+            hints=challenge.hints if not is_correct else _EMPTY_HINTS
         )
     
     def _evaluate_code_completion(
@@ -231,7 +343,17 @@ class ChallengeEvaluator:
         # Check for required patterns
         if "patterns" in challenge.answer:
             patterns = challenge.answer["patterns"]
-            matches = sum(1 for pattern in patterns if pattern in user_code)
+            if challenge.answer.get("patterns_are_tokens"):
+                # Patterns are plain identifiers: tokenize the code once
+                # and check membership in the set instead of scanning
+                # the whole buffer per pattern
+                tokens = set(_TOKEN_RE.findall(user_code))
+                matches = sum(1 for pattern in patterns if pattern in tokens)
+            else:
+                # Substring search runs in C; prebinding __contains__
+                # keeps the per-pattern loop to a single call
+                contains = user_code.__contains__
+                matches = sum(1 for pattern in patterns if contains(pattern))
             
             percentage = matches / len(patterns) if patterns else 0
             points = int(challenge.points * percentage)
@@ -245,7 +367,7 @@ class ChallengeEvaluator:
         # Check for exact match (simplified)
         elif "code" in challenge.answer:
             expected_code = challenge.answer["code"].strip()
-            is_correct = self._normalize_code(user_code) == self._normalize_code(expected_code)
+            is_correct = _normalize_code(user_code) == _normalize_code(expected_code)
             
             if is_correct:
                 feedback = "✅ Perfect code!"
@@ -266,7 +388,7 @@ class ChallengeEvaluator:
             points_earned=points,
             max_points=challenge.points,
             feedback=feedback,
-            hints=challenge.hints if not is_correct else []
+            hints=challenge.hints if not is_correct else _EMPTY_HINTS
         )
     
     def _evaluate_debugging(
@@ -295,9 +417,9 @@ class ChallengeEvaluator:
         Expected challenge.answer format: {"pattern": "correct_pattern"}
         """
         user_selection = user_answer.get("pattern", "").strip()
-        correct_pattern = challenge.answer.get("pattern", "").strip()
-        
-        is_correct = user_selection.lower() == correct_pattern.lower()
+        correct_pattern = _stripped_answer(challenge, "pattern")
+
+        is_correct = user_selection.lower() == _normalized_answer(challenge, "pattern")
         
         if is_correct:
             feedback = f"✅ Correct! This is the {correct_pattern} pattern."
@@ -312,7 +434,7 @@ class ChallengeEvaluator:
             points_earned=points,
             max_points=challenge.points,
             feedback=feedback,
-            hints=challenge.hints if not is_correct else []
+            hints=challenge.hints if not is_correct else _EMPTY_HINTS
         )
     
     def evaluate_level(
@@ -334,28 +456,32 @@ class ChallengeEvaluator:
         Returns:
             LevelResult with overall score and challenge results
         """
-        challenge_results: List[ChallengeResult] = []
-        total_score = 0
-        max_score = 0
-        
         # Get attempts (for first attempt bonus)
         # This would come from ProgressService in real implementation
         is_first_attempt = True  # Simplified
-        
-        # Evaluate each challenge
-        for challenge in level.challenges:
-            user_answer = user_answers.get(challenge.id, {})
-            result = self.evaluate_challenge(challenge, user_answer)
-            
-            challenge_results.append(result)
-            total_score += result.points_earned
-            max_score += result.max_points
-        
-        # Determine if level is completed (70% threshold)
-        completion_threshold = 0.7
-        percentage = (total_score / max_score * 100) if max_score > 0 else 0
-        level_completed = percentage >= (completion_threshold * 100)
-        
+
+        # Resolve each challenge's evaluator once up front so the loop
+        # body is just the handler call; unknown types fall back to the
+        # full evaluate_challenge path
+        evaluators = self._EVALUATORS
+        answers_get = user_answers.get
+        plan = [
+            (evaluators.get(challenge.type, ChallengeEvaluator.evaluate_challenge),
+             challenge,
+             answers_get(challenge.id, {}))
+            for challenge in level.challenges
+        ]
+        challenge_results: List[ChallengeResult] = [
+            evaluator(self, challenge, user_answer)
+            for evaluator, challenge, user_answer in plan
+        ]
+        total_score = sum(result.points_earned for result in challenge_results)
+        max_score = sum(result.max_points for result in challenge_results)
+        
+        # Determine if level is completed (70% threshold); integer
+        # cross-multiplication avoids float division and rounding
+        level_completed = max_score > 0 and total_score * 10 >= max_score * 7
+
         is_perfect = total_score == max_score
         
         return LevelResult(
@@ -381,29 +507,33 @@ class ChallengeEvaluator:
         Returns:
             True if match, False otherwise
         """
-        # Normalize both strings
-        user_normalized = re.sub(r'\s+', '', user_input.lower())
-        correct_normalized = re.sub(r'\s+', '', correct_answer.lower())
-        
+        # Verbatim answers are the common case; an exact comparison
+        # short-circuits before any normalization allocates
+        if user_input == correct_answer:
+            return True
+
+        # Normalize both strings; split()/join strips all whitespace in
+        # one C pass without involving the regex engine at all
+        user_normalized = ''.join(user_input.lower().split())
+        correct_normalized = ''.join(correct_answer.lower().split())
+
         return user_normalized == correct_normalized
-    
-    def _normalize_code(self, code: str) -> str:
-        """
-        Normalize code for comparison
-        
-        Args:
-            code: Source code
-        
-        Returns:
-            Normalized code
-        """
-        # Remove comments
-        code = re.sub(r'#.*$', '', code, flags=re.MULTILINE)
-        
-        # Normalize whitespace
-        code = re.sub(r'\s+', ' ', code)
-        
-        return code.strip().lower()
+
+    # Challenge type -> evaluator method, resolved with a single dict
+    # lookup in evaluate_challenge instead of an if/elif chain.
+    # Declared after the methods so the names are bound.
+    _EVALUATORS: ClassVar[Dict[ChallengeType, Callable]] = {
+        ChallengeType.MULTIPLE_CHOICE: _evaluate_multiple_choice,
+        ChallengeType.CODE_TRACING: _evaluate_code_tracing,
+        ChallengeType.FILL_BLANK: _evaluate_fill_blank,
+        ChallengeType.CODE_COMPLETION: _evaluate_code_completion,
+        ChallengeType.DEBUGGING: _evaluate_debugging,
+        ChallengeType.ARCHITECTURE: _evaluate_architecture,
+    }
+
+
+# The evaluator is stateless, so one shared instance serves all callers
+DEFAULT_EVALUATOR = ChallengeEvaluator()
 
 
 # ============================================
@@ -417,7 +547,7 @@ if __name__ == '__main__':
     print("Challenge Evaluator Demo")
     print("="*60)
     
-    evaluator = ChallengeEvaluator()
+    evaluator = DEFAULT_EVALUATOR
     
     # Test Multiple Choice
     print("\n1. Multiple Choice Challenge...")
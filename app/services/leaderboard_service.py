@@ -5,8 +5,9 @@ Manages user rankings and leaderboards for competition and motivation.
 Supports global, weekly, and project-specific leaderboards.
 """
 
+from bisect import bisect_left, insort
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
 from app.services.models import LeaderboardEntry, UserStats
@@ -25,9 +26,29 @@ class LeaderboardService:
     def __init__(self):
         # In-memory storage (would be database/Redis in production)
         self._user_stats_cache: Dict[str, UserStats] = {}
-        self._weekly_xp: Dict[str, int] = {}  # user_id -> weekly XP
-        self._project_scores: Dict[str, Dict[str, int]] = {}  # project_id -> {user_id -> score}
-        self._user_info: Dict[str, Dict] = {}  # user_id -> {username, avatar}
+        self._weekly_xp: Dict[str, int] = defaultdict(int)  # user_id -> weekly XP
+        self._project_scores: Dict[str, Dict[str, int]] = defaultdict(dict)  # project_id -> {user_id -> score}
+        self._user_info: Dict[str, Tuple[str, Optional[str]]] = {}  # user_id -> (username, avatar)
+
+        # Sorted indexes kept up to date on every write so leaderboard
+        # reads are a slice instead of a scan. Keys are
+        # (-score, seq, user_id): negated score sorts descending, and
+        # the per-index insertion sequence preserves the stable tie
+        # order a full sort would produce.
+        self._global_index: List[Tuple[int, int, str]] = []
+        self._global_key: Dict[str, Tuple[int, int, str]] = {}
+        self._weekly_index: List[Tuple[int, int, str]] = []
+        self._weekly_key: Dict[str, Tuple[int, int, str]] = {}
+        self._project_index: Dict[str, List[Tuple[int, int, str]]] = defaultdict(list)
+        self._project_keys: Dict[str, Dict[str, Tuple[int, int, str]]] = defaultdict(dict)
+        self._index_seq = 0
+
+        # Rank lookups are memoized until the next write; the
+        # generation counter bumps on every mutation and invalidates
+        # the cache wholesale
+        self._write_gen = 0
+        self._rank_cache: Dict[Tuple[str, str, Optional[str]], int] = {}
+        self._rank_cache_gen = 0
     
     def register_user(self, user_id: str, username: str, avatar: str = None) -> None:
         """
@@ -38,10 +59,7 @@ class LeaderboardService:
             username: Display name
             avatar: Avatar URL (optional)
         """
-        self._user_info[user_id] = {
-            "username": username,
-            "avatar": avatar
-        }
+        self._user_info[user_id] = (username, avatar)
     
     def update_user_stats(self, user_id: str, user_stats: UserStats) -> None:
         """
@@ -52,6 +70,10 @@ class LeaderboardService:
             user_stats: Updated user statistics
         """
         self._user_stats_cache[user_id] = user_stats
+        self._write_gen += 1
+        self._reindex(
+            self._global_index, self._global_key, user_id, user_stats.total_xp
+        )
     
     def record_weekly_xp(self, user_id: str, xp_earned: int) -> None:
         """
@@ -61,9 +83,11 @@ class LeaderboardService:
             user_id: User identifier
             xp_earned: Amount of XP earned
         """
-        if user_id not in self._weekly_xp:
-            self._weekly_xp[user_id] = 0
         self._weekly_xp[user_id] += xp_earned
+        self._write_gen += 1
+        self._reindex(
+            self._weekly_index, self._weekly_key, user_id, self._weekly_xp[user_id]
+        )
     
     def record_project_score(self, user_id: str, project_id: str, score: int) -> None:
         """
@@ -74,12 +98,46 @@ class LeaderboardService:
             project_id: Project identifier
             score: Total score for project
         """
-        if project_id not in self._project_scores:
-            self._project_scores[project_id] = {}
-        
         # Only update if better than previous score
-        current = self._project_scores[project_id].get(user_id, 0)
-        self._project_scores[project_id][user_id] = max(current, score)
+        scores = self._project_scores[project_id]
+        current = scores.get(user_id)
+        new_score = max(current, score) if current is not None else max(0, score)
+        if current != new_score:
+            scores[user_id] = new_score
+            self._reindex(
+                self._project_index[project_id],
+                self._project_keys[project_id],
+                user_id,
+                new_score
+            )
+        self._write_gen += 1
+
+    def _reindex(
+        self,
+        index: List[Tuple[int, int, str]],
+        key_by_user: Dict[str, Tuple[int, int, str]],
+        user_id: str,
+        score: int
+    ) -> None:
+        """
+        Move a user to their new position in a sorted index
+
+        Args:
+            index: Sorted list of (-score, seq, user_id) keys
+            key_by_user: Current key per user
+            user_id: User identifier
+            score: New score
+        """
+        old_key = key_by_user.get(user_id)
+        if old_key is not None:
+            del index[bisect_left(index, old_key)]
+            seq = old_key[1]
+        else:
+            seq = self._index_seq
+            self._index_seq += 1
+        new_key = (-score, seq, user_id)
+        insort(index, new_key)
+        key_by_user[user_id] = new_key
     
     def get_global_leaderboard(self, limit: int = 50) -> List[LeaderboardEntry]:
         """
@@ -91,33 +149,22 @@ class LeaderboardService:
         Returns:
             List of leaderboard entries, sorted by XP
         """
-        # Get all users with stats
-        entries = []
-        for user_id, stats in self._user_stats_cache.items():
-            user_info = self._user_info.get(user_id, {})
-            entries.append({
-                "user_id": user_id,
-                "username": user_info.get("username", f"User {user_id[:8]}"),
-                "avatar": user_info.get("avatar"),
-                "score": stats.total_xp,
-                "level": stats.current_level
-            })
-        
-        # Sort by XP (descending)
-        entries.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Assign ranks and create LeaderboardEntry objects
+        # The index is kept sorted on every write, so the page is just
+        # the first limit keys
         leaderboard = []
-        for rank, entry in enumerate(entries[:limit], start=1):
+        for rank, (neg_xp, _seq, user_id) in enumerate(
+            self._global_index[:limit], start=1
+        ):
+            username, avatar = self._user_info.get(
+                user_id, (f"User {user_id[:8]}", None)
+            )
+            stats = self._user_stats_cache[user_id]
+            # Positional construction: field order is
+            # (rank, user_id, username, score, avatar, level)
             leaderboard.append(LeaderboardEntry(
-                rank=rank,
-                user_id=entry["user_id"],
-                username=entry["username"],
-                score=entry["score"],
-                avatar=entry["avatar"],
-                level=entry["level"]
+                rank, user_id, username, -neg_xp, avatar, stats.current_level
             ))
-        
+
         return leaderboard
     
     def get_weekly_leaderboard(self, limit: int = 50) -> List[LeaderboardEntry]:
@@ -130,35 +177,21 @@ class LeaderboardService:
         Returns:
             List of leaderboard entries, sorted by weekly XP
         """
-        # Get all users with weekly XP
-        entries = []
-        for user_id, weekly_xp in self._weekly_xp.items():
-            user_info = self._user_info.get(user_id, {})
-            stats = self._user_stats_cache.get(user_id)
-            
-            entries.append({
-                "user_id": user_id,
-                "username": user_info.get("username", f"User {user_id[:8]}"),
-                "avatar": user_info.get("avatar"),
-                "score": weekly_xp,
-                "level": stats.current_level if stats else None
-            })
-        
-        # Sort by weekly XP (descending)
-        entries.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Assign ranks
+        # Served straight from the sorted weekly index
         leaderboard = []
-        for rank, entry in enumerate(entries[:limit], start=1):
+        for rank, (neg_xp, _seq, user_id) in enumerate(
+            self._weekly_index[:limit], start=1
+        ):
+            weekly_xp = -neg_xp
+            username, avatar = self._user_info.get(
+                user_id, (f"User {user_id[:8]}", None)
+            )
+            stats = self._user_stats_cache.get(user_id)
             leaderboard.append(LeaderboardEntry(
-                rank=rank,
-                user_id=entry["user_id"],
-                username=entry["username"],
-                score=entry["score"],
-                avatar=entry["avatar"],
-                level=entry["level"]
+                rank, user_id, username, weekly_xp, avatar,
+                stats.current_level if stats else None
             ))
-        
+
         return leaderboard
     
     def get_project_leaderboard(
@@ -176,37 +209,22 @@ class LeaderboardService:
         Returns:
             List of leaderboard entries, sorted by project score
         """
-        project_scores = self._project_scores.get(project_id, {})
-        
-        # Get all users with scores for this project
-        entries = []
-        for user_id, score in project_scores.items():
-            user_info = self._user_info.get(user_id, {})
-            stats = self._user_stats_cache.get(user_id)
-            
-            entries.append({
-                "user_id": user_id,
-                "username": user_info.get("username", f"User {user_id[:8]}"),
-                "avatar": user_info.get("avatar"),
-                "score": score,
-                "level": stats.current_level if stats else None
-            })
-        
-        # Sort by score (descending)
-        entries.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Assign ranks
+        # Served straight from the per-project sorted index
+        index = self._project_index.get(project_id, [])
+
+        # Assign ranks, looking up info and stats only for survivors
         leaderboard = []
-        for rank, entry in enumerate(entries[:limit], start=1):
+        for rank, (neg_score, _seq, user_id) in enumerate(index[:limit], start=1):
+            score = -neg_score
+            username, avatar = self._user_info.get(
+                user_id, (f"User {user_id[:8]}", None)
+            )
+            stats = self._user_stats_cache.get(user_id)
             leaderboard.append(LeaderboardEntry(
-                rank=rank,
-                user_id=entry["user_id"],
-                username=entry["username"],
-                score=entry["score"],
-                avatar=entry["avatar"],
-                level=entry["level"]
+                rank, user_id, username, score, avatar,
+                stats.current_level if stats else None
             ))
-        
+
         return leaderboard
     
     def get_user_rank(
@@ -226,29 +244,58 @@ class LeaderboardService:
         Returns:
             User's rank (1-based), or 0 if not ranked
         """
+        if self._rank_cache_gen != self._write_gen:
+            self._rank_cache.clear()
+            self._rank_cache_gen = self._write_gen
+
+        cache_key = (user_id, leaderboard_type, project_id)
+        rank = self._rank_cache.get(cache_key)
+        if rank is not None:
+            return rank
+
         if leaderboard_type == "global":
-            leaderboard = self.get_global_leaderboard(limit=10000)
+            key = self._global_key.get(user_id)
+            rank = bisect_left(self._global_index, key) + 1 if key is not None else 0
         elif leaderboard_type == "weekly":
-            leaderboard = self.get_weekly_leaderboard(limit=10000)
+            key = self._weekly_key.get(user_id)
+            rank = bisect_left(self._weekly_index, key) + 1 if key is not None else 0
         elif leaderboard_type == "project":
             if not project_id:
                 return 0
-            leaderboard = self.get_project_leaderboard(project_id, limit=10000)
+            rank = self._project_rank(project_id, user_id)
         else:
             return 0
-        
-        # Find user's rank
-        for entry in leaderboard:
-            if entry.user_id == user_id:
-                return entry.rank
-        
-        return 0  # Not ranked
+
+        self._rank_cache[cache_key] = rank
+        return rank
+
+    def _project_rank(self, project_id: str, user_id: str) -> int:
+        """
+        Rank within a project via its sorted index
+
+        Args:
+            project_id: Project identifier
+            user_id: User identifier
+
+        Returns:
+            1-based rank, or 0 if the user has no score
+        """
+        keys = self._project_keys.get(project_id)
+        if not keys:
+            return 0
+        key = keys.get(user_id)
+        if key is None:
+            return 0
+        return bisect_left(self._project_index[project_id], key) + 1
     
     def reset_weekly_leaderboard(self) -> None:
         """
         Reset weekly XP (should be called weekly via cron job)
         """
         self._weekly_xp.clear()
+        self._weekly_index.clear()
+        self._weekly_key.clear()
+        self._write_gen += 1
 
 
 # ============================================
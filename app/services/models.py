@@ -5,9 +5,10 @@ Shared data models used across all game engine services.
 These complement the core analyzer models with user-specific data.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from enum import Enum
 
 
@@ -26,7 +27,13 @@ class AchievementCategory(Enum):
     SOCIAL = "social"
 
 
-@dataclass
+# Enum member -> interned value string, so bulk to_dict calls do one
+# dict lookup instead of going through the enum .value descriptor
+_STATUS_VALUES = {status: sys.intern(status.value) for status in LevelStatus}
+_CATEGORY_VALUES = {category: sys.intern(category.value) for category in AchievementCategory}
+
+
+@dataclass(slots=True)
 class LevelProgress:
     """Tracks user progress on a single level"""
     user_id: str
@@ -55,16 +62,20 @@ class LevelProgress:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API responses"""
+        # Reuse the score fields instead of dispatching through the
+        # properties a second time
+        best_score = self.best_score
+        max_score = self.max_score
         return {
             "user_id": self.user_id,
             "project_id": self.project_id,
             "level_id": self.level_id,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "attempts": self.attempts,
-            "best_score": self.best_score,
-            "max_score": self.max_score,
-            "completion_percentage": self.completion_percentage,
-            "is_perfect": self.is_perfect,
+            "best_score": best_score,
+            "max_score": max_score,
+            "completion_percentage": (best_score / max_score * 100) if max_score else 0.0,
+            "is_perfect": best_score == max_score,
             "time_spent": self.time_spent,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
@@ -72,7 +83,7 @@ class LevelProgress:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectProgress:
     """Tracks user progress on an entire project"""
     user_id: str
@@ -102,13 +113,14 @@ class ProjectProgress:
     @property
     def average_score(self) -> float:
         """Calculate average score across all levels"""
-        if not self.level_progress:
-            return 0.0
-        completed = [lp for lp in self.level_progress if lp.status == LevelStatus.COMPLETED]
-        if not completed:
-            return 0.0
-        total_score = sum(lp.best_score for lp in completed)
-        total_max = sum(lp.max_score for lp in completed)
+        # Single pass: accumulate both sums without building an
+        # intermediate list of completed levels
+        total_score = 0
+        total_max = 0
+        for lp in self.level_progress:
+            if lp.status == LevelStatus.COMPLETED:
+                total_score += lp.best_score
+                total_max += lp.max_score
         return (total_score / total_max * 100) if total_max > 0 else 0.0
     
     def to_dict(self) -> Dict[str, Any]:
@@ -131,7 +143,7 @@ class ProjectProgress:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChallengeResult:
     """Result of evaluating a single challenge"""
     challenge_id: str
@@ -139,7 +151,7 @@ class ChallengeResult:
     points_earned: int
     max_points: int
     feedback: str
-    hints: List[str] = field(default_factory=list)
+    hints: Sequence[str] = ()
     execution_time: Optional[float] = None  # For code challenges
     
     def to_dict(self) -> Dict[str, Any]:
@@ -155,7 +167,7 @@ class ChallengeResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LevelResult:
     """Result of completing a level"""
     level_id: str
@@ -191,7 +203,7 @@ class LevelResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class XPAward:
     """Details of an XP award"""
     amount: int
@@ -209,7 +221,7 @@ class XPAward:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LevelUp:
     """Details of a level up event"""
     old_level: int
@@ -227,7 +239,7 @@ class LevelUp:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """Overall user statistics"""
     user_id: str
@@ -259,7 +271,7 @@ class UserStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Achievement:
     """An achievement that users can unlock"""
     id: str
@@ -278,14 +290,14 @@ class Achievement:
             "name": self.name,
             "description": self.description,
             "icon": self.icon,
-            "category": self.category.value,
+            "category": _CATEGORY_VALUES[self.category],
             "xp_reward": self.xp_reward,
             "condition": self.condition,
             "unlocked_at": self.unlocked_at.isoformat() if self.unlocked_at else None
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaderboardEntry:
     """Entry in a leaderboard"""
     rank: int